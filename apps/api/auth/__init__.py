@@ -1,4 +1,13 @@
-from .deps import auth_required, require_roles, require_plan, require_feature, require_org
+from .deps import (
+    auth_required,
+    require_roles,
+    require_plan,
+    require_feature,
+    require_org,
+    require_roles_http,
+    require_plan_http,
+    require_feature_http,
+)
 from .models import AuthClaims
 
 __all__ = [
@@ -7,5 +16,8 @@ __all__ = [
     "require_plan",
     "require_feature",
     "require_org",
+    "require_roles_http",
+    "require_plan_http",
+    "require_feature_http",
     "AuthClaims",
 ]
\ No newline at end of file
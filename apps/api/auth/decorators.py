@@ -8,6 +8,13 @@ class GuardError(PermissionError):
     pass
 
 
+# Guard failures are raised from prebuilt instances (see the factories below);
+# the traceback is reset on each raise so shared instances don't accumulate frames.
+_MISSING_CLAIMS_ERR = GuardError("Missing authentication claims")
+_AUTH_REQUIRED_ERR = GuardError("Authentication required")
+_ORG_MISMATCH_ERR = GuardError("Access denied: organization mismatch")
+
+
 def guard_roles(*allowed: str):
     """
     Decorator that enforces role-based access control on service functions.
@@ -24,18 +31,18 @@ def guard_roles(*allowed: str):
     Raises:
         GuardError: If user doesn't have required role or claims are missing
     """
-    allowed_norm = {r.lower() for r in allowed}
+    allowed_norm = frozenset(r.lower() for r in allowed)
+    denied_err = GuardError(f"Insufficient role. Required: {', '.join(allowed)}")
     
     def _wrap(fn: Callable) -> Callable:
         @wraps(fn)
         def _inner(*args, **kwargs):
             claims: AuthClaims = kwargs.get("claims")
             if not claims:
-                raise GuardError("Missing authentication claims")
+                raise _MISSING_CLAIMS_ERR.with_traceback(None)
             
-            user_roles = {r.lower() for r in (claims.roles or [])}
-            if not allowed_norm.intersection(user_roles):
-                raise GuardError(f"Insufficient role. Required: {', '.join(allowed)}")
+            if allowed_norm.isdisjoint(claims._roles_lower):
+                raise denied_err.with_traceback(None)
             
             return fn(*args, **kwargs)
         return _inner
@@ -58,18 +65,18 @@ def guard_plan(*plans: str):
     Raises:
         GuardError: If user doesn't have required plan or claims are missing
     """
-    plans_norm = {p.lower() for p in plans}
+    plans_norm = frozenset(p.lower() for p in plans)
+    denied_err = GuardError(f"Upgrade required. Required plan: {', '.join(plans)}")
     
     def _wrap(fn: Callable) -> Callable:
         @wraps(fn)
         def _inner(*args, **kwargs):
             claims: AuthClaims = kwargs.get("claims")
             if not claims:
-                raise GuardError("Missing authentication claims")
+                raise _MISSING_CLAIMS_ERR.with_traceback(None)
             
-            plan = (claims.plan or "").lower()
-            if plan not in plans_norm:
-                raise GuardError(f"Upgrade required. Required plan: {', '.join(plans)}")
+            if claims._plan_lower not in plans_norm:
+                raise denied_err.with_traceback(None)
             
             return fn(*args, **kwargs)
         return _inner
@@ -93,17 +100,17 @@ def guard_feature(feature: str):
         GuardError: If feature is not enabled or claims are missing
     """
     feature_norm = feature.lower()
+    denied_err = GuardError(f"Feature '{feature}' not enabled")
     
     def _wrap(fn: Callable) -> Callable:
         @wraps(fn)
         def _inner(*args, **kwargs):
             claims: AuthClaims = kwargs.get("claims")
             if not claims:
-                raise GuardError("Missing authentication claims")
+                raise _MISSING_CLAIMS_ERR.with_traceback(None)
             
-            features = {f.lower() for f in (claims.features or [])}
-            if feature_norm not in features:
-                raise GuardError(f"Feature '{feature}' not enabled")
+            if feature_norm not in claims._features_lower:
+                raise denied_err.with_traceback(None)
             
             return fn(*args, **kwargs)
         return _inner
@@ -126,19 +133,21 @@ def guard_org(org_param: str = "org_id"):
     Raises:
         GuardError: If user doesn't belong to org or claims/org_id are missing
     """
+    missing_err = GuardError(f"Missing required parameter: {org_param}")
+
     def _wrap(fn: Callable) -> Callable:
         @wraps(fn)
         def _inner(*args, **kwargs):
             claims: AuthClaims = kwargs.get("claims")
             if not claims:
-                raise GuardError("Missing authentication claims")
+                raise _MISSING_CLAIMS_ERR.with_traceback(None)
             
             org_id = kwargs.get(org_param)
             if not org_id:
-                raise GuardError(f"Missing required parameter: {org_param}")
+                raise missing_err.with_traceback(None)
             
             if not claims.belongs_to_org(org_id):
-                raise GuardError("Access denied: organization mismatch")
+                raise _ORG_MISMATCH_ERR.with_traceback(None)
             
             return fn(*args, **kwargs)
         return _inner
@@ -162,7 +171,7 @@ def guard_authenticated(fn: Callable) -> Callable:
     def _inner(*args, **kwargs):
         claims: AuthClaims = kwargs.get("claims")
         if not claims:
-            raise GuardError("Authentication required")
+            raise _AUTH_REQUIRED_ERR.with_traceback(None)
         return fn(*args, **kwargs)
     return _inner
 
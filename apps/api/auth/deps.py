@@ -1,17 +1,53 @@
 from fastapi import Depends, Header, HTTPException, Request, status
-from .jwt import verify_access_jwt
+from .jwt import TokenCache, verify_access_jwt
 from .models import AuthClaims
 from api.services.auth_service import get_current_user
 
+# Fully built AuthClaims per verified token, so repeat requests with the same
+# bearer token skip both signature verification and model construction.
+_claims_cache = TokenCache()
+
+
+# Raised often on anonymous/malformed traffic; built once and re-raised with a
+# fresh traceback each time.
+_MISSING_BEARER_EXC = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Missing bearer token"
+)
+_NOT_AUTHENTICATED_EXC = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Not authenticated"
+)
+_ORG_MISMATCH_EXC = HTTPException(
+    status_code=status.HTTP_403_FORBIDDEN,
+    detail="Access denied: organization mismatch"
+)
+
+
+def _extract_bearer_token_or_none(authorization: str | None) -> str | None:
+    """Extract bearer token from Authorization header, or None if absent or not Bearer."""
+    if not authorization or authorization[:7].lower() != "bearer ":
+        return None
+    return authorization[7:].strip()
+
 
 def _extract_bearer_token(authorization: str | None) -> str:
     """Extract bearer token from Authorization header."""
-    if not authorization or not authorization.lower().startswith("bearer "):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, 
-            detail="Missing bearer token"
-        )
-    return authorization.split(" ", 1)[1].strip()
+    token = _extract_bearer_token_or_none(authorization)
+    if token is None:
+        raise _MISSING_BEARER_EXC.with_traceback(None)
+    return token
+
+
+def _claims_from_token(token: str) -> AuthClaims:
+    """Verify a bearer token and build its AuthClaims, reusing cached results."""
+    cache_key = TokenCache.key(token)
+    claims = _claims_cache.get(cache_key)
+    if claims is None:
+        claims_dict = verify_access_jwt(token)
+        claims = AuthClaims.from_token_claims(claims_dict)
+        _claims_cache.put(cache_key, claims, claims_dict.get("exp"))
+    return claims
 
 
 async def _claims_from_session(request: Request) -> AuthClaims | None:
@@ -37,15 +73,13 @@ async def auth_required(request: Request, authorization: str | None = Header(Non
         HTTPException: 401 if token is missing or invalid
     """
     if authorization:
-        token = _extract_bearer_token(authorization)
-        claims_dict = verify_access_jwt(token)
-        return AuthClaims(**claims_dict)
+        return _claims_from_token(_extract_bearer_token(authorization))
 
     claims = await _claims_from_session(request)
     if claims:
         return claims
 
-    raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+    raise _NOT_AUTHENTICATED_EXC.with_traceback(None)
 
 
 def require_roles(*allowed: str):
@@ -61,22 +95,21 @@ def require_roles(*allowed: str):
     Raises:
         HTTPException: 403 if user doesn't have required role
     """
-    allowed_norm = {r.lower() for r in allowed}
-    
+    allowed_norm = frozenset(r.lower() for r in allowed)
+    exc = HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail=f"Insufficient role. Required: {', '.join(allowed)}"
+    )
+
     async def _dep(claims_or_auth: AuthClaims | str = Depends(auth_required)) -> AuthClaims:
         # Support being called directly in tests with an authorization header
         if isinstance(claims_or_auth, str):
-            claims_dict = verify_access_jwt(_extract_bearer_token(claims_or_auth))
-            claims = AuthClaims(**claims_dict)
+            claims = _claims_from_token(_extract_bearer_token(claims_or_auth))
         else:
             claims = claims_or_auth
 
-        user_roles = {r.lower() for r in (claims.roles or [])}
-        if not allowed_norm.intersection(user_roles):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Insufficient role. Required: {', '.join(allowed)}"
-            )
+        if allowed_norm.isdisjoint(claims._roles_lower):
+            raise exc.with_traceback(None)
         return claims
     
     return _dep
@@ -95,21 +128,20 @@ def require_plan(*plans: str):
     Raises:
         HTTPException: 402 if user doesn't have required plan
     """
-    plans_norm = {p.lower() for p in plans}
-    
+    plans_norm = frozenset(p.lower() for p in plans)
+    exc = HTTPException(
+        status_code=status.HTTP_402_PAYMENT_REQUIRED,
+        detail=f"Upgrade required. Required plan: {', '.join(plans)}"
+    )
+
     async def _dep(claims_or_auth: AuthClaims | str = Depends(auth_required)) -> AuthClaims:
         if isinstance(claims_or_auth, str):
-            claims_dict = verify_access_jwt(_extract_bearer_token(claims_or_auth))
-            claims = AuthClaims(**claims_dict)
+            claims = _claims_from_token(_extract_bearer_token(claims_or_auth))
         else:
             claims = claims_or_auth
 
-        plan = (claims.plan or "").lower()
-        if plan not in plans_norm:
-            raise HTTPException(
-                status_code=status.HTTP_402_PAYMENT_REQUIRED,
-                detail=f"Upgrade required. Required plan: {', '.join(plans)}"
-            )
+        if claims._plan_lower not in plans_norm:
+            raise exc.with_traceback(None)
         return claims
     
     return _dep
@@ -129,25 +161,78 @@ def require_feature(flag: str):
         HTTPException: 403 if feature is not enabled for user
     """
     flag_norm = flag.lower()
-    
+    exc = HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail=f"Feature '{flag}' not enabled"
+    )
+
     async def _dep(claims_or_auth: AuthClaims | str = Depends(auth_required)) -> AuthClaims:
         if isinstance(claims_or_auth, str):
-            claims_dict = verify_access_jwt(_extract_bearer_token(claims_or_auth))
-            claims = AuthClaims(**claims_dict)
+            claims = _claims_from_token(_extract_bearer_token(claims_or_auth))
         else:
             claims = claims_or_auth
 
-        features = {f.lower() for f in (claims.features or [])}
-        if flag_norm not in features:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Feature '{flag}' not enabled"
-            )
+        if flag_norm not in claims._features_lower:
+            raise exc.with_traceback(None)
         return claims
     
     return _dep
 
 
+def require_roles_http(*allowed: str):
+    """
+    HTTP-only variant of ``require_roles`` for route dependencies.
+
+    Skips the direct-call (authorization string) branch and raises a 403
+    built once when the factory runs.
+    """
+    allowed_norm = frozenset(r.lower() for r in allowed)
+    exc = HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail=f"Insufficient role. Required: {', '.join(allowed)}"
+    )
+
+    async def _dep(claims: AuthClaims = Depends(auth_required)) -> AuthClaims:
+        if allowed_norm.isdisjoint(claims._roles_lower):
+            # Reset the traceback so the shared instance doesn't accumulate frames
+            raise exc.with_traceback(None)
+        return claims
+
+    return _dep
+
+
+def require_plan_http(*plans: str):
+    """HTTP-only variant of ``require_plan``; raises a prebuilt 402."""
+    plans_norm = frozenset(p.lower() for p in plans)
+    exc = HTTPException(
+        status_code=status.HTTP_402_PAYMENT_REQUIRED,
+        detail=f"Upgrade required. Required plan: {', '.join(plans)}"
+    )
+
+    async def _dep(claims: AuthClaims = Depends(auth_required)) -> AuthClaims:
+        if claims._plan_lower not in plans_norm:
+            raise exc.with_traceback(None)
+        return claims
+
+    return _dep
+
+
+def require_feature_http(flag: str):
+    """HTTP-only variant of ``require_feature``; raises a prebuilt 403."""
+    flag_norm = flag.lower()
+    exc = HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail=f"Feature '{flag}' not enabled"
+    )
+
+    async def _dep(claims: AuthClaims = Depends(auth_required)) -> AuthClaims:
+        if flag_norm not in claims._features_lower:
+            raise exc.with_traceback(None)
+        return claims
+
+    return _dep
+
+
 def require_org(org_id_param: str = "org_id"):
     """
     FastAPI dependency factory that ensures user belongs to specified org.
@@ -163,34 +248,31 @@ def require_org(org_id_param: str = "org_id"):
     Raises:
         HTTPException: 403 if user doesn't belong to the specified org
     """
+    missing_exc = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Missing required parameter: {org_id_param}"
+    )
+
     def _dep(
         claims_or_auth: AuthClaims | str = Depends(auth_required),
         request: Request = None
     ) -> AuthClaims:
         # Support direct calls where the first arg is an authorization header
         if isinstance(claims_or_auth, str):
-            claims_dict = verify_access_jwt(_extract_bearer_token(claims_or_auth))
-            claims = AuthClaims(**claims_dict)
+            claims = _claims_from_token(_extract_bearer_token(claims_or_auth))
         else:
             claims = claims_or_auth
 
         # Try to get org_id from path params first, then query params
-        param_value = (
-            request.path_params.get(org_id_param) or 
-            request.query_params.get(org_id_param)
-        )
+        param_value = request.path_params.get(org_id_param)
+        if param_value is None:
+            param_value = request.query_params.get(org_id_param)
 
         if not param_value:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Missing required parameter: {org_id_param}"
-            )
+            raise missing_exc.with_traceback(None)
 
         if not claims.belongs_to_org(param_value):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied: organization mismatch"
-            )
+            raise _ORG_MISMATCH_EXC.with_traceback(None)
 
         return claims
     
@@ -207,10 +289,12 @@ async def optional_auth(request: Request, authorization: str | None = Header(Non
     if not authorization:
         return await _claims_from_session(request)
 
+    token = _extract_bearer_token_or_none(authorization)
+    if token is None:
+        return None
+
     try:
-        token = _extract_bearer_token(authorization)
-        claims_dict = verify_access_jwt(token)
-        return AuthClaims(**claims_dict)
+        return _claims_from_token(token)
     except HTTPException:
         # Return None instead of raising error for optional auth
         return None
@@ -1,7 +1,15 @@
-from datetime import datetime, timedelta, timezone
-from typing import Optional
+from collections import OrderedDict
+from typing import Any, Optional
+import binascii
+import hashlib
+import hmac
 import os
+import threading
+import time
+import weakref
 import jwt
+import orjson
+from jwt.utils import base64url_decode, base64url_encode
 from fastapi import HTTPException, status
 
 APP_JWT_AUDIENCE = os.getenv("APP_JWT_AUDIENCE", "webapp-factory")
@@ -9,6 +17,12 @@ APP_JWT_ISSUER = os.getenv("APP_JWT_ISSUER", "https://api.example.com")
 APP_JWT_ALG = os.getenv("APP_JWT_ALG", "HS256")  # For RS256 use public/private keys + JWKS
 APP_JWT_SECRET = os.getenv("APP_JWT_SECRET", "dev-secret-change-me")
 
+# Verified tokens are cached briefly so a bearer token reused across requests
+# does not pay for signature verification every time. Entries never outlive
+# the token's own ``exp`` and are keyed by a digest, never the raw token.
+VERIFY_CACHE_MAX_ENTRIES = 10_000
+VERIFY_CACHE_TTL_SECONDS = 5.0
+
 
 class JWTError(HTTPException):
     """Custom JWT authentication error."""
@@ -17,6 +31,157 @@ class JWTError(HTTPException):
         super().__init__(status_code=status.HTTP_401_UNAUTHORIZED, detail=detail)
 
 
+# Every TokenCache, so clear_verify_cache() also reaches caches owned by other
+# modules (e.g. the AuthClaims cache in auth.deps).
+_token_caches: "weakref.WeakSet[TokenCache]" = weakref.WeakSet()
+
+
+class TokenCache:
+    """Bounded, thread-safe LRU cache for values derived from verified tokens."""
+
+    def __init__(self, max_entries: int = VERIFY_CACHE_MAX_ENTRIES, ttl_seconds: float = VERIFY_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[bytes, tuple[Any, float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        _token_caches.add(self)
+
+    @staticmethod
+    def key(token: str) -> bytes:
+        """Return the cache key for a token."""
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Any | None:
+        """Return the cached value for ``key`` or None when missing or stale."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at, token_exp = entry
+            if expires_at <= time.monotonic() or token_exp <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: bytes, value: Any, token_exp: Any) -> None:
+        """Cache ``value`` until the TTL elapses or the token expires.
+
+        Entries whose ``token_exp`` is not a number are not cached.
+        """
+        now = time.time()
+        if token_exp is None:
+            token_exp = now + self.ttl_seconds
+        else:
+            try:
+                token_exp = float(token_exp)
+            except (TypeError, ValueError, OverflowError):
+                return
+        lifetime = min(token_exp - now, self.ttl_seconds)
+        if lifetime <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + lifetime, token_exp)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_verify_cache = TokenCache()
+
+
+def clear_verify_cache() -> None:
+    """Drop all cached verification results (e.g. after rotating the secret)."""
+    for cache in list(_token_caches):
+        cache.clear()
+
+
+# Registered claims every access token must carry; enforced by both decode paths.
+_REQUIRED_CLAIMS = ("exp", "iat", "sub", "aud", "iss")
+
+# HS256 tokens are verified without going through PyJWT: the HMAC key schedule
+# (ipad/opad blocks) is computed once here and copied per token.
+_hmac_template = hmac.new(APP_JWT_SECRET.encode(), digestmod=hashlib.sha256)
+
+# The JOSE header never changes, so it is serialized and encoded once.
+_JWT_HEADER_B64 = base64url_encode(orjson.dumps({"alg": APP_JWT_ALG, "typ": "JWT"}))
+
+
+def _b64_json(segment: bytes) -> Any:
+    try:
+        return orjson.loads(base64url_decode(segment))
+    except (binascii.Error, ValueError) as exc:
+        raise jwt.DecodeError("Invalid segment encoding") from exc
+
+
+def _decode_hs256(token: str) -> dict:
+    """
+    Verify an HS256 token and validate its registered claims.
+
+    Mirrors the checks ``jwt.decode`` performs for our tokens and raises the
+    same PyJWT exception types, so callers can handle both paths alike.
+    """
+    try:
+        signing_input, _, sig_b64 = token.encode("ascii").rpartition(b".")
+        header_b64, _, payload_b64 = signing_input.partition(b".")
+        signature = base64url_decode(sig_b64)
+    except (UnicodeEncodeError, binascii.Error, ValueError) as exc:
+        raise jwt.DecodeError("Invalid token encoding") from exc
+    if not header_b64 or not payload_b64 or b"." in payload_b64:
+        raise jwt.DecodeError("Not enough segments")
+
+    header = _b64_json(header_b64)
+    if not isinstance(header, dict) or header.get("alg") != "HS256":
+        raise jwt.InvalidAlgorithmError("The specified alg value is not allowed")
+
+    mac = _hmac_template.copy()
+    mac.update(signing_input)
+    if not hmac.compare_digest(mac.digest(), signature):
+        raise jwt.InvalidSignatureError("Signature verification failed")
+
+    claims = _b64_json(payload_b64)
+    if not isinstance(claims, dict):
+        raise jwt.DecodeError("Invalid payload string: must be a json object")
+
+    for name in _REQUIRED_CLAIMS:
+        if claims.get(name) is None:
+            raise jwt.MissingRequiredClaimError(name)
+
+    now = time.time()
+    for name in ("iat", "nbf", "exp"):
+        if name in claims:
+            try:
+                claims_ts = int(claims[name])
+            except (ValueError, TypeError, OverflowError):
+                raise jwt.DecodeError(f"{name} claim must be an integer") from None
+            if name == "exp":
+                if claims_ts <= now:
+                    raise jwt.ExpiredSignatureError("Signature has expired")
+            elif claims_ts > now:
+                raise jwt.ImmatureSignatureError(f"The token is not yet valid ({name})")
+
+    audience = claims["aud"]
+    if isinstance(audience, str):
+        audience = [audience]
+    if not isinstance(audience, list) or APP_JWT_AUDIENCE not in audience:
+        raise jwt.InvalidAudienceError("Audience doesn't match")
+
+    if claims["iss"] != APP_JWT_ISSUER:
+        raise jwt.InvalidIssuerError("Invalid issuer")
+
+    if not isinstance(claims["sub"], str):
+        raise jwt.InvalidTokenError("Subject must be a string")
+
+    return claims
+
+
 def sign_access_jwt(
     *,
     sub: str,
@@ -42,7 +207,7 @@ def sign_access_jwt(
     Returns:
         JWT token string
     """
-    now = datetime.now(timezone.utc)
+    now = int(time.time())
     payload = {
         "sub": sub,
         "email": email,
@@ -50,12 +215,18 @@ def sign_access_jwt(
         "roles": roles or [],
         "plan": plan,
         "features": features or [],
-        "iat": int(now.timestamp()),
-        "exp": int((now + timedelta(minutes=ttl_minutes)).timestamp()),
+        "iat": now,
+        "exp": now + ttl_minutes * 60,
         "aud": APP_JWT_AUDIENCE,
         "iss": APP_JWT_ISSUER,
     }
-    return jwt.encode(payload, APP_JWT_SECRET, algorithm=APP_JWT_ALG)
+    if APP_JWT_ALG != "HS256":
+        return jwt.encode(payload, APP_JWT_SECRET, algorithm=APP_JWT_ALG)
+
+    signing_input = _JWT_HEADER_B64 + b"." + base64url_encode(orjson.dumps(payload))
+    mac = _hmac_template.copy()
+    mac.update(signing_input)
+    return (signing_input + b"." + base64url_encode(mac.digest())).decode("ascii")
 
 
 def verify_access_jwt(token: str) -> dict:
@@ -74,28 +245,38 @@ def verify_access_jwt(token: str) -> dict:
     if not token:
         raise JWTError("Invalid token")
 
+    cache_key = TokenCache.key(token)
+    cached = _verify_cache.get(cache_key)
+    if cached is not None:
+        # Claims are cached serialized, so every hit gets its own nested lists
+        return orjson.loads(cached)
+
     try:
-        # Decode and verify signature/audience/issuer/exp automatically.
-        # Do not force 'sub' to be required by the jwt library so we can
-        # provide a clearer, custom error message when missing.
-        claims = jwt.decode(
-            token,
-            APP_JWT_SECRET,
-            algorithms=[APP_JWT_ALG],
-            audience=APP_JWT_AUDIENCE,
-        )
+        # Decode and verify signature/audience/issuer/exp; the required
+        # registered claims are enforced by the decoder itself.
+        if APP_JWT_ALG == "HS256":
+            claims = _decode_hs256(token)
+        else:
+            claims = jwt.decode(
+                token,
+                APP_JWT_SECRET,
+                algorithms=[APP_JWT_ALG],
+                audience=APP_JWT_AUDIENCE,
+                issuer=APP_JWT_ISSUER,
+                options={"require": list(_REQUIRED_CLAIMS), "verify_iss": True},
+            )
+        if not claims["sub"]:
+            raise jwt.MissingRequiredClaimError("sub")
     except jwt.ExpiredSignatureError:
         raise JWTError("Token expired")
+    except jwt.MissingRequiredClaimError as exc:
+        # Keep a specific message for a missing subject so callers can tell
+        # it apart from a generic invalid token.
+        raise JWTError("Missing subject" if exc.claim == "sub" else "Invalid token")
     except jwt.InvalidTokenError:
         raise JWTError("Invalid token")
-    
-    # Basic sanity checks
-    if not claims.get("sub"):
-        # If token decoded successfully but subject is missing, raise a
-        # specific error to help callers distinguish this case from a
-        # generic invalid token.
-        raise JWTError("Missing subject")
-    
+
+    _verify_cache.put(cache_key, orjson.dumps(claims), claims.get("exp"))
     return claims
 
 
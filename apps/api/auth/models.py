@@ -1,83 +1,91 @@
-from typing import List, Optional
-from types import MethodType
-from pydantic import BaseModel, Field, ValidationError, validator
+from dataclasses import dataclass, field
+from typing import Any, Mapping, Optional
 
 
-class AuthClaims(BaseModel):
+def _as_str_tuple(value: Any, name: str) -> tuple[str, ...]:
+    # Normalize None to an empty tuple and ensure the value is an iterable of strings
+    if value is None:
+        return ()
+    if isinstance(value, (tuple, list, set, frozenset)):
+        items = tuple(value)
+        if all(isinstance(item, str) for item in items):
+            return items
+    raise ValueError(f"{name} must be a list of strings")
+
+
+@dataclass(slots=True, frozen=True)
+class AuthClaims:
     """
     Authentication claims extracted from JWT token.
-    
+
     This model represents the claims contained in a validated JWT access token.
     Standard JWT claims (exp, iat, iss, aud) are validated but not included here.
+    Instances are immutable so they can be safely shared across requests.
     """
-    
-    sub: str = Field(..., min_length=1)  # Subject (user ID)
+
+    sub: str  # Subject (user ID)
     email: Optional[str] = None
     orgId: Optional[str] = None
-    roles: List[str] = Field(default_factory=list)
+    roles: tuple[str, ...] = ()
     plan: Optional[str] = None
-    features: List[str] = Field(default_factory=list)
+    features: tuple[str, ...] = ()
+
+    _roles_lower: frozenset[str] = field(init=False, repr=False, compare=False)
+    _features_lower: frozenset[str] = field(init=False, repr=False, compare=False)
+    _plan_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if not isinstance(self.sub, str) or not self.sub:
+            raise ValueError("sub must be a non-empty string")
 
-    @validator("roles", "features", pre=True, always=True)
-    def ensure_list(cls, v):
-        # Normalize None to empty list and ensure the value is an iterable of strings
-        if v is None:
-            return []
+        if self.orgId is not None and not isinstance(self.orgId, str):
+            object.__setattr__(self, "orgId", str(self.orgId))
 
-        if isinstance(v, (list, tuple, set)):
-            return list(v)
+        roles = _as_str_tuple(self.roles, "roles")
+        features = _as_str_tuple(self.features, "features")
+        object.__setattr__(self, "roles", roles)
+        object.__setattr__(self, "features", features)
+        object.__setattr__(self, "_roles_lower", frozenset(r.lower() for r in roles))
+        object.__setattr__(self, "_features_lower", frozenset(f.lower() for f in features))
+        object.__setattr__(self, "_plan_lower", (self.plan or "").lower())
+
+    @classmethod
+    def from_token_claims(cls, claims: Mapping[str, Any]) -> "AuthClaims":
+        """Build claims from a decoded JWT payload, ignoring registered claims."""
+        return cls(
+            sub=claims["sub"],
+            email=claims.get("email"),
+            orgId=claims.get("orgId"),
+            roles=claims.get("roles"),
+            plan=claims.get("plan"),
+            features=claims.get("features"),
+        )
 
-        raise ValueError("must be a list of strings")
-    
     def has_role(self, role: str) -> bool:
         """Check if user has a specific role (case-insensitive)."""
-        return role.lower() in [r.lower() for r in self.roles]
-    
+        return role.lower() in self._roles_lower
+
     def has_any_role(self, *roles: str) -> bool:
         """Check if user has any of the specified roles (case-insensitive)."""
-        user_roles = {r.lower() for r in self.roles}
-        allowed_roles = {r.lower() for r in roles}
-        return bool(user_roles.intersection(allowed_roles))
-    
+        return any(r.lower() in self._roles_lower for r in roles)
+
     def has_plan(self, *plans: str) -> bool:
         """Check if user has one of the specified plans (case-insensitive)."""
         # Treat only None as 'no plan'; empty string is a valid plan value
         if self.plan is None:
             return False
-        return self.plan.lower() in [p.lower() for p in plans]
-    
+        return any(p.lower() == self._plan_lower for p in plans)
+
     def has_feature(self, feature: str) -> bool:
         """Check if user has access to a specific feature (case-insensitive)."""
-        return feature.lower() in [f.lower() for f in self.features]
-    
+        return feature.lower() in self._features_lower
+
     def belongs_to_org(self, org_id: str) -> bool:
         """Check if user belongs to the specified organization."""
         # Treat only None as 'no org'; empty string should be compared normally
         if self.orgId is None:
             return False
-        return str(self.orgId) == str(org_id)
-
-    def __init__(self, **data):
-        try:
-            super().__init__(**data)
-        except ValidationError as exc:
-            original_errors = exc.errors
-
-            def _errors_with_field(self_exc):
-                formatted = []
-                for err in original_errors():
-                    loc = err.get("loc") or ()
-                    field = loc[0] if loc else None
-                    err_type = err.get("type") or "value_error"
-                    if err_type.endswith("missing"):
-                        err_type = "missing"
-                    formatted.append(
-                        {
-                            "field": field,
-                            "type": err_type,
-                        }
-                    )
-                return formatted
-
-            exc.errors = MethodType(_errors_with_field, exc)
-            raise exc
+        if self.orgId == org_id:
+            return True
+        # Non-string ids (e.g. ints passed to service guards) compare by their str form
+        return not isinstance(org_id, str) and self.orgId == str(org_id)
@@ -9,7 +9,7 @@ from .auth import AuthConfig
 from .database import DatabaseConfig
 from .features import FeatureFlagsConfig
 from .logging import LoggingConfig
-from .base import BaseConfig, Environment
+from .base import BaseConfig, Environment, FrozenConfig, env_snapshot
 
 __all__ = [
     "AuthConfig",
@@ -17,5 +17,7 @@ __all__ = [
     "FeatureFlagsConfig",
     "LoggingConfig",
     "BaseConfig",
+    "FrozenConfig",
     "Environment",
+    "env_snapshot",
 ]
\ No newline at end of file
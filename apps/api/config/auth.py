@@ -8,35 +8,60 @@ This module contains all authentication-related configuration including:
 - Session management
 """
 
-from typing import List, Optional
-from pydantic import Field, validator
-from .base import BaseConfig, Environment
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, List, Optional, Tuple
+from pydantic import PrivateAttr, model_validator, validator
+from .base import Environment, FrozenConfig, config_field, env_snapshot
 
 
-class JWTConfig(BaseConfig):
+# Placeholder JWT secret that must be replaced outside development/testing
+_DEFAULT_JWT_SECRET = "your-secret-key-here-change-in-production"
+
+# Origins must carry an explicit scheme (e.g. 'https://app.example.com')
+_ALLOWED_ORIGIN_PREFIXES = ("http://", "https://")
+
+
+# Read-only default templates; each model instance gets its own copy
+_DEFAULT_ROLE_HIERARCHY = MappingProxyType({
+    "guest": 0,
+    "user": 10,
+    "moderator": 20,
+    "admin": 30,
+    "super_admin": 40,
+})
+
+_DEFAULT_CORS_ORIGINS = (
+    "http://localhost:3000",
+    "http://127.0.0.1:5173",
+    "http://localhost:8080",
+)
+
+
+class JWTConfig(FrozenConfig):
     """JWT token configuration."""
     
     # Core JWT settings
-    secret_key: str = Field(
-        default="your-secret-key-here-change-in-production",
+    secret_key: str = config_field(
+        default=_DEFAULT_JWT_SECRET,
         description="Secret key for JWT signing (minimum 256 bits for HS256)",
         min_length=32
     )
     
-    algorithm: str = Field(
+    algorithm: str = config_field(
         default="HS256",
         description="JWT signing algorithm"
     )
     
     # Token expiration
-    access_token_expire_minutes: int = Field(
+    access_token_expire_minutes: int = config_field(
         default=15,
         description="Access token expiration in minutes",
         ge=1,
         le=1440  # Max 24 hours
     )
     
-    refresh_token_expire_days: int = Field(
+    refresh_token_expire_days: int = config_field(
         default=30,
         description="Refresh token expiration in days",
         ge=1,
@@ -44,12 +69,12 @@ class JWTConfig(BaseConfig):
     )
     
     # JWT Claims
-    issuer: str = Field(
+    issuer: str = config_field(
         default="webapp-factory-api",
         description="JWT issuer (iss claim)"
     )
     
-    audience: str = Field(
+    audience: str = config_field(
         default="webapp-factory-app",
         description="JWT audience (aud claim)"
     )
@@ -57,40 +82,37 @@ class JWTConfig(BaseConfig):
     @validator('secret_key')
     def validate_secret_key(cls, v):
         """Ensure secret key is strong enough for production."""
-        if len(v) < 32:
-            raise ValueError("JWT secret key must be at least 32 characters long")
-        if v == "your-secret-key-here-change-in-production":
+        # Length (min_length=32) is enforced by the field constraint
+        if v == _DEFAULT_JWT_SECRET:
             # Allow default only in development/testing
-            import os
-            env = os.getenv("APP_ENV", "development")
-            if env == "production":
+            if env_snapshot().get("APP_ENV", "development") == "production":
                 raise ValueError("Must set a custom JWT secret key in production")
         return v
 
 
-class OAuthProviderConfig(BaseConfig):
+class OAuthProviderConfig(FrozenConfig):
     """OAuth provider configuration."""
     
-    provider_name: str = Field(description="OAuth provider name (e.g., 'google', 'github')")
-    client_id: str = Field(description="OAuth client ID")
-    client_secret: str = Field(description="OAuth client secret")
+    provider_name: str = config_field(description="OAuth provider name (e.g., 'google', 'github')")
+    client_id: str = config_field(description="OAuth client ID")
+    client_secret: str = config_field(description="OAuth client secret")
     
     # OAuth 2.0 URLs
-    authorization_url: Optional[str] = Field(
+    authorization_url: Optional[str] = config_field(
         default=None,
         description="OAuth authorization URL"
     )
-    token_url: Optional[str] = Field(
+    token_url: Optional[str] = config_field(
         default=None, 
         description="OAuth token exchange URL"
     )
-    user_info_url: Optional[str] = Field(
+    user_info_url: Optional[str] = config_field(
         default=None,
         description="URL to fetch user information"
     )
     
     # Scopes
-    scopes: List[str] = Field(
+    scopes: List[str] = config_field(
         default_factory=list,
         description="OAuth scopes to request"
     )
@@ -106,207 +128,208 @@ class GoogleOAuthConfig(OAuthProviderConfig):
     scopes: List[str] = ["openid", "email", "profile"]
 
 
-class SecurityPolicyConfig(BaseConfig):
+class SecurityPolicyConfig(FrozenConfig):
     """Security policy configuration."""
     
     # Password requirements
-    min_password_length: int = Field(
+    min_password_length: int = config_field(
         default=8,
         description="Minimum password length",
         ge=6
     )
     
-    require_password_uppercase: bool = Field(
+    require_password_uppercase: bool = config_field(
         default=True,
         description="Require at least one uppercase letter in passwords"
     )
     
-    require_password_lowercase: bool = Field(
+    require_password_lowercase: bool = config_field(
         default=True,
         description="Require at least one lowercase letter in passwords"
     )
     
-    require_password_numbers: bool = Field(
+    require_password_numbers: bool = config_field(
         default=True,
         description="Require at least one number in passwords"
     )
     
-    require_password_special_chars: bool = Field(
+    require_password_special_chars: bool = config_field(
         default=False,
         description="Require at least one special character in passwords"
     )
     
     # Session security
-    max_sessions_per_user: int = Field(
+    max_sessions_per_user: int = config_field(
         default=5,
         description="Maximum concurrent sessions per user",
         ge=1
     )
     
-    session_timeout_minutes: int = Field(
+    session_timeout_minutes: int = config_field(
         default=60,
         description="Session timeout in minutes",
         ge=5
     )
     
     # Account security
-    max_login_attempts: int = Field(
+    max_login_attempts: int = config_field(
         default=5,
         description="Maximum failed login attempts before lockout",
         ge=1
     )
     
-    lockout_duration_minutes: int = Field(
+    lockout_duration_minutes: int = config_field(
         default=15,
         description="Account lockout duration in minutes",
         ge=1
     )
     
     # Multi-factor authentication
-    mfa_enabled: bool = Field(
+    mfa_enabled: bool = config_field(
         default=False,
         description="Enable multi-factor authentication"
     )
     
-    mfa_required_for_admin: bool = Field(
+    mfa_required_for_admin: bool = config_field(
         default=True,
         description="Require MFA for admin users"
     )
 
 
-class RoleConfig(BaseConfig):
+class RoleConfig(FrozenConfig):
     """Role-based access control configuration."""
     
     # Default roles
-    default_user_role: str = Field(
+    default_user_role: str = config_field(
         default="user",
         description="Default role assigned to new users"
     )
     
-    admin_role: str = Field(
+    admin_role: str = config_field(
         default="admin",
         description="Admin role name"
     )
     
     # Role hierarchy (higher number = more permissions)
-    role_hierarchy: dict = Field(
-        default_factory=lambda: {
-            "guest": 0,
-            "user": 10,
-            "moderator": 20,
-            "admin": 30,
-            "super_admin": 40,
-        },
+    role_hierarchy: dict = config_field(
+        default_factory=_DEFAULT_ROLE_HIERARCHY.copy,
         description="Role hierarchy with permission levels"
     )
     
     # Permission inheritance
-    inherit_permissions: bool = Field(
+    inherit_permissions: bool = config_field(
         default=True,
         description="Whether higher roles inherit lower role permissions"
     )
 
 
-class AuthConfig(BaseConfig):
+class AuthConfig(FrozenConfig):
     """Main authentication configuration."""
     
-    environment: Environment = Field(
+    environment: Environment = config_field(
         default=Environment.DEVELOPMENT,
         description="Application environment"
     )
     
     # Component configurations
-    jwt: JWTConfig = Field(default_factory=JWTConfig)
-    security_policy: SecurityPolicyConfig = Field(default_factory=SecurityPolicyConfig)
-    roles: RoleConfig = Field(default_factory=RoleConfig)
+    jwt: JWTConfig = config_field(default_factory=JWTConfig)
+    security_policy: SecurityPolicyConfig = config_field(default_factory=SecurityPolicyConfig)
+    roles: RoleConfig = config_field(default_factory=RoleConfig)
     
     # OAuth providers
-    google_oauth: Optional[GoogleOAuthConfig] = Field(
+    google_oauth: Optional[GoogleOAuthConfig] = config_field(
         default=None,
         description="Google OAuth configuration"
     )
     
     # Custom OAuth providers
-    oauth_providers: List[OAuthProviderConfig] = Field(
+    oauth_providers: List[OAuthProviderConfig] = config_field(
         default_factory=list,
         description="Additional OAuth providers"
     )
     
     # Redirect URLs
-    oauth_redirect_uri: str = Field(
+    oauth_redirect_uri: str = config_field(
         default="http://127.0.0.1:5173/auth/callback",
         description="OAuth redirect URI"
     )
     
     # CORS settings for auth endpoints
-    cors_origins: List[str] = Field(
-        default_factory=lambda: [
-            "http://localhost:3000",
-            "http://127.0.0.1:5173",
-            "http://localhost:8080",
-        ],
+    cors_origins: List[str] = config_field(
+        default_factory=lambda: list(_DEFAULT_CORS_ORIGINS),
         description="Allowed CORS origins for auth endpoints"
     )
     
     # Auth endpoints
-    auth_endpoints_enabled: bool = Field(
+    auth_endpoints_enabled: bool = config_field(
         default=True,
         description="Enable auth endpoints (/auth/login, /auth/callback, etc.)"
     )
     
     # Cookie settings
-    cookie_domain: Optional[str] = Field(
+    cookie_domain: Optional[str] = config_field(
         default=None,
         description="Cookie domain for auth cookies"
     )
     
-    cookie_secure: bool = Field(
+    cookie_secure: bool = config_field(
         default=False,
         description="Use secure cookies (HTTPS only)"
     )
     
-    cookie_httponly: bool = Field(
+    cookie_httponly: bool = config_field(
         default=True,
         description="Use HTTP-only cookies"
     )
     
-    cookie_samesite: str = Field(
+    cookie_samesite: str = config_field(
         default="lax",
         description="SameSite cookie policy"
     )
     
+    # provider_name -> config, built once by _build_provider_index
+    _provider_index: Dict[str, OAuthProviderConfig] = PrivateAttr(default_factory=dict)
+    
     @validator('cors_origins')
     def validate_cors_origins(cls, v):
         """Validate CORS origins format."""
-        for origin in v:
-            if not origin.startswith(('http://', 'https://')):
-                raise ValueError(f"CORS origin must include protocol: {origin}")
+        bad = [origin for origin in v if not origin.startswith(_ALLOWED_ORIGIN_PREFIXES)]
+        if bad:
+            raise ValueError(f"CORS origin must include protocol: {', '.join(bad)}")
         return v
     
+    @model_validator(mode="after")
+    def _build_provider_index(self):
+        index: Dict[str, OAuthProviderConfig] = {}
+        for provider in self.oauth_providers:
+            index.setdefault(provider.provider_name, provider)
+        if self.google_oauth:
+            index["google"] = self.google_oauth
+        self._provider_index = index
+        return self
+    
     def get_oauth_provider(self, provider_name: str) -> Optional[OAuthProviderConfig]:
         """Get OAuth provider configuration by name."""
-        if provider_name == "google" and self.google_oauth:
-            return self.google_oauth
-        
-        for provider in self.oauth_providers:
-            if provider.provider_name == provider_name:
-                return provider
-        
-        return None
+        return self._provider_index.get(provider_name)
     
     def is_production_ready(self) -> bool:
         """Check if auth configuration is ready for production."""
-        if self.environment != Environment.PRODUCTION:
+        return self._production_ready
+    
+    @cached_property
+    def _production_ready(self) -> bool:
+        # Cheap boolean checks come before string comparisons
+        if self.environment is not Environment.PRODUCTION:
             return True
         
-        # Check JWT secret
-        if self.jwt.secret_key == "your-secret-key-here-change-in-production":
-            return False
-        
         # Check security settings
         if not self.cookie_secure:
             return False
         
+        # Check JWT secret
+        if self.jwt.secret_key == _DEFAULT_JWT_SECRET:
+            return False
+        
         # Check OAuth configuration
         if self.google_oauth and not self.google_oauth.client_secret:
             return False
@@ -314,33 +337,31 @@ class AuthConfig(BaseConfig):
         return True
 
 
-# Default configuration instances
-def get_auth_config() -> AuthConfig:
+# Default configuration instances. Factories are cached so the validated models
+# are built once per process; call ``<factory>.cache_clear()`` to rebuild them.
+@lru_cache(maxsize=len(Environment))
+def get_auth_config(environment: Environment = Environment.DEVELOPMENT) -> AuthConfig:
     """Get authentication configuration from environment variables."""
-    return AuthConfig()
+    return AuthConfig(environment=environment)
 
 
+@lru_cache(maxsize=1)
 def get_jwt_config() -> JWTConfig:
     """Get JWT configuration from environment variables."""
     return JWTConfig()
 
 
-# Configuration validation
+# Configuration validation: (check, message) pairs applied to production configs
+_AUTH_PRODUCTION_RULES: Tuple[Tuple[Callable[[AuthConfig], bool], str], ...] = (
+    (lambda c: not c.is_production_ready(), "Configuration is not production ready"),
+    (lambda c: c.jwt.secret_key == _DEFAULT_JWT_SECRET, "JWT secret key must be changed in production"),
+    (lambda c: not c.cookie_secure, "Secure cookies should be enabled in production"),
+    (lambda c: c.jwt.access_token_expire_minutes > 60, "Consider shorter access token expiration in production"),
+)
+
+
 def validate_auth_config(config: AuthConfig) -> List[str]:
     """Validate authentication configuration and return list of issues."""
-    issues = []
-    
-    if config.environment == Environment.PRODUCTION:
-        if not config.is_production_ready():
-            issues.append("Configuration is not production ready")
-        
-        if config.jwt.secret_key == "your-secret-key-here-change-in-production":
-            issues.append("JWT secret key must be changed in production")
-        
-        if not config.cookie_secure:
-            issues.append("Secure cookies should be enabled in production")
-        
-        if config.jwt.access_token_expire_minutes > 60:
-            issues.append("Consider shorter access token expiration in production")
-    
-    return issues
\ No newline at end of file
+    if config.environment is not Environment.PRODUCTION:
+        return []
+    return [message for check, message in _AUTH_PRODUCTION_RULES if check(config)]
@@ -2,13 +2,44 @@
 Base configuration classes and utilities.
 """
 
-from enum import Enum
-from typing import Any, Dict
-from pydantic import BaseModel, Field
+import os
+from enum import StrEnum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
+from pydantic_core import PydanticUndefined
 
-class Environment(str, Enum):
-    """Application environment types."""
+
+# Field descriptions only matter for generated docs/schemas; keep them out of
+# the field metadata unless explicitly requested (APP_CONFIG_DOCS=1).
+INCLUDE_FIELD_DESCRIPTIONS = os.getenv("APP_CONFIG_DOCS", "0") == "1"
+
+
+# Prefix shared by the application's environment variables (see the .env templates)
+_ENV_PREFIX = "APP_"
+
+
+@lru_cache(maxsize=1)
+def env_snapshot() -> Mapping[str, str]:
+    """
+    Read-only copy of the ``APP_*`` environment variables, taken in one pass on first call.
+
+    Call ``env_snapshot.cache_clear()`` to pick up later changes to ``os.environ``.
+    """
+    return MappingProxyType({k: v for k, v in os.environ.items() if k.startswith(_ENV_PREFIX)})
+
+
+def config_field(default: Any = PydanticUndefined, *, description: Optional[str] = None, **kwargs: Any) -> Any:
+    """``pydantic.Field`` that drops ``description`` unless APP_CONFIG_DOCS=1."""
+    if INCLUDE_FIELD_DESCRIPTIONS and description is not None:
+        kwargs["description"] = description
+    return Field(default, **kwargs)
+
+
+class Environment(StrEnum):
+    """Application environment types (members are singletons, so ``is`` comparisons are valid)."""
     DEVELOPMENT = "development"
     TESTING = "testing"
     STAGING = "staging"
@@ -18,7 +49,9 @@ class Environment(str, Enum):
 class BaseConfig(BaseModel):
     """Base configuration class with common utilities."""
     
-    model_config = {"env_file": ".env", "extra": "ignore"}
+    # Validators/serializers are compiled on first use rather than at import, so
+    # config models a process never instantiates cost nothing.
+    model_config = {"env_file": ".env", "extra": "ignore", "defer_build": True}
     
     def get_env_vars(self) -> Dict[str, Any]:
         """Get all environment variables as a dictionary."""
@@ -26,12 +59,49 @@ class BaseConfig(BaseModel):
     
     def is_production(self) -> bool:
         """Check if running in production environment."""
-        return getattr(self, 'environment', Environment.DEVELOPMENT) == Environment.PRODUCTION
+        return getattr(self, 'environment', Environment.DEVELOPMENT) is Environment.PRODUCTION
+    
+    def is_development(self) -> bool:
+        """Check if running in development environment."""
+        return getattr(self, 'environment', Environment.DEVELOPMENT) is Environment.DEVELOPMENT
+    
+    def is_testing(self) -> bool:
+        """Check if running in testing environment."""
+        return getattr(self, 'environment', Environment.DEVELOPMENT) is Environment.TESTING
+
+
+class FrozenConfig(BaseConfig):
+    """
+    Immutable configuration built once and shared.
+
+    Instances can't be modified after construction, so values derived from
+    their fields are computed once. Build variants by constructing a new
+    instance; ``model_copy(update=...)`` skips validation and would carry
+    stale derived values.
+    """
+    
+    model_config = {"frozen": True}
+    
+    _env_is_production: bool = PrivateAttr(default=False)
+    _env_is_development: bool = PrivateAttr(default=True)
+    _env_is_testing: bool = PrivateAttr(default=False)
+    
+    @model_validator(mode="after")
+    def _cache_environment_flags(self):
+        environment = getattr(self, 'environment', Environment.DEVELOPMENT)
+        self._env_is_production = environment is Environment.PRODUCTION
+        self._env_is_development = environment is Environment.DEVELOPMENT
+        self._env_is_testing = environment is Environment.TESTING
+        return self
+    
+    def is_production(self) -> bool:
+        """Check if running in production environment."""
+        return self._env_is_production
     
     def is_development(self) -> bool:
         """Check if running in development environment."""
-        return getattr(self, 'environment', Environment.DEVELOPMENT) == Environment.DEVELOPMENT
+        return self._env_is_development
     
     def is_testing(self) -> bool:
         """Check if running in testing environment."""
-        return getattr(self, 'environment', Environment.DEVELOPMENT) == Environment.TESTING
\ No newline at end of file
+        return self._env_is_testing
@@ -8,100 +8,115 @@ This module contains configuration for all database connections including:
 - Environment-specific settings
 """
 
-from typing import Optional, Dict, Any, List
-from pydantic import Field, validator
-from .base import BaseConfig, Environment
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Annotated, Any, Callable, Dict, List, Mapping, Optional, Tuple
+from pydantic import AfterValidator, model_validator
+from .base import Environment, FrozenConfig, config_field
 
 
-class FirestoreConfig(BaseConfig):
+# Read-only default templates; each model instance gets its own copy
+_DEFAULT_COLLECTIONS = MappingProxyType({
+    "users": "users",
+    "organizations": "organizations",
+    "sessions": "sessions",
+    "audit_logs": "audit_logs",
+    "feature_flags": "feature_flags",
+})
+
+_DEFAULT_KEY_PREFIXES = MappingProxyType({
+    "session": "session:",
+    "cache": "cache:",
+    "rate_limit": "rate_limit:",
+    "auth": "auth:",
+    "temp": "temp:",
+})
+
+
+def _validate_emulator_host(v: Optional[str]) -> Optional[str]:
+    """Validate emulator host format."""
+    if v and '://' in v:
+        raise ValueError("Emulator host should not include protocol (use 'localhost:8080', not 'http://localhost:8080')")
+    return v
+
+
+class FirestoreConfig(FrozenConfig):
     """Google Firestore configuration."""
     
     # Project settings
-    project_id: str = Field(
+    project_id: str = config_field(
         default="webapp-factory-dev",
         description="Google Cloud Project ID"
     )
     
     # Authentication
-    credentials_path: Optional[str] = Field(
+    credentials_path: Optional[str] = config_field(
         default=None,
         description="Path to service account key file"
     )
     
     # Emulator settings (for development/testing)
-    emulator_host: Optional[str] = Field(
+    emulator_host: Annotated[Optional[str], AfterValidator(_validate_emulator_host)] = config_field(
         default=None,
         description="Firestore emulator host (e.g., localhost:8080)"
     )
     
-    use_emulator: bool = Field(
+    use_emulator: bool = config_field(
         default=False,
         description="Use Firestore emulator instead of cloud"
     )
     
     # Database settings
-    database_id: str = Field(
+    database_id: str = config_field(
         default="(default)",
         description="Firestore database ID"
     )
     
     # Collection names
-    collections: Dict[str, str] = Field(
-        default_factory=lambda: {
-            "users": "users",
-            "organizations": "organizations", 
-            "sessions": "sessions",
-            "audit_logs": "audit_logs",
-            "feature_flags": "feature_flags",
-        },
+    collections: Dict[str, str] = config_field(
+        default_factory=_DEFAULT_COLLECTIONS.copy,
         description="Firestore collection names"
     )
     
     # Connection settings
-    timeout_seconds: int = Field(
+    timeout_seconds: int = config_field(
         default=30,
         description="Request timeout in seconds",
         ge=1,
         le=300
     )
     
-    max_retries: int = Field(
+    max_retries: int = config_field(
         default=3,
         description="Maximum number of retries for failed requests",
         ge=0,
         le=10
     )
     
-    @validator('emulator_host')
-    def validate_emulator_host(cls, v):
-        """Validate emulator host format."""
-        if v and '://' in v:
-            raise ValueError("Emulator host should not include protocol (use 'localhost:8080', not 'http://localhost:8080')")
-        return v
 
 
-class RedisConfig(BaseConfig):
+class RedisConfig(FrozenConfig):
     """Redis configuration for caching and sessions."""
     
     # Connection settings
-    url: str = Field(
+    url: str = config_field(
         default="redis://localhost:6379",
         description="Redis connection URL"
     )
     
-    host: str = Field(
+    host: str = config_field(
         default="localhost",
         description="Redis host"
     )
     
-    port: int = Field(
+    port: int = config_field(
         default=6379,
         description="Redis port",
         ge=1,
         le=65535
     )
     
-    database: int = Field(
+    database: int = config_field(
         default=0,
         description="Redis database number",
         ge=0,
@@ -109,32 +124,32 @@ class RedisConfig(BaseConfig):
     )
     
     # Authentication
-    password: Optional[str] = Field(
+    password: Optional[str] = config_field(
         default=None,
         description="Redis password"
     )
     
-    username: Optional[str] = Field(
+    username: Optional[str] = config_field(
         default=None,
         description="Redis username (Redis 6.0+)"
     )
     
     # Connection pool settings
-    max_connections: int = Field(
+    max_connections: int = config_field(
         default=100,
         description="Maximum connections in pool",
         ge=1,
         le=1000
     )
     
-    connection_timeout: int = Field(
+    connection_timeout: int = config_field(
         default=5,
         description="Connection timeout in seconds",
         ge=1,
         le=60
     )
     
-    socket_timeout: int = Field(
+    socket_timeout: int = config_field(
         default=5,
         description="Socket timeout in seconds",
         ge=1,
@@ -142,12 +157,12 @@ class RedisConfig(BaseConfig):
     )
     
     # Retry settings
-    retry_on_timeout: bool = Field(
+    retry_on_timeout: bool = config_field(
         default=True,
         description="Retry on timeout errors"
     )
     
-    max_retries: int = Field(
+    max_retries: int = config_field(
         default=3,
         description="Maximum retry attempts",
         ge=0,
@@ -155,179 +170,180 @@ class RedisConfig(BaseConfig):
     )
     
     # Key prefixes
-    key_prefixes: Dict[str, str] = Field(
-        default_factory=lambda: {
-            "session": "session:",
-            "cache": "cache:",
-            "rate_limit": "rate_limit:",
-            "auth": "auth:",
-            "temp": "temp:",
-        },
+    key_prefixes: Dict[str, str] = config_field(
+        default_factory=_DEFAULT_KEY_PREFIXES.copy,
         description="Redis key prefixes for different data types"
     )
     
     # TTL settings (in seconds)
-    default_ttl: int = Field(
+    default_ttl: int = config_field(
         default=3600,  # 1 hour
         description="Default TTL for cached items",
         ge=1
     )
     
-    session_ttl: int = Field(
+    session_ttl: int = config_field(
         default=86400,  # 24 hours
         description="TTL for session data",
         ge=60
     )
     
-    rate_limit_ttl: int = Field(
+    rate_limit_ttl: int = config_field(
         default=3600,  # 1 hour
         description="TTL for rate limit counters",
         ge=1
     )
 
 
-class DatabasePoolConfig(BaseConfig):
+class DatabasePoolConfig(FrozenConfig):
     """Database connection pooling configuration."""
     
     # Pool sizes
-    min_pool_size: int = Field(
+    min_pool_size: int = config_field(
         default=5,
         description="Minimum connections to maintain",
         ge=1
     )
     
-    max_pool_size: int = Field(
+    max_pool_size: int = config_field(
         default=20,
         description="Maximum connections allowed",
         ge=1
     )
     
     # Connection lifecycle
-    max_idle_time: int = Field(
+    max_idle_time: int = config_field(
         default=300,  # 5 minutes
         description="Maximum idle time before closing connection",
         ge=60
     )
     
-    connection_timeout: int = Field(
+    connection_timeout: int = config_field(
         default=30,
         description="Timeout for getting connection from pool",
         ge=1
     )
     
     # Health checks
-    health_check_interval: int = Field(
+    health_check_interval: int = config_field(
         default=60,  # 1 minute
         description="Health check interval in seconds",
         ge=10
     )
     
-    @validator('max_pool_size')
-    def validate_pool_sizes(cls, v, values):
+    @model_validator(mode="after")
+    def validate_pool_sizes(self):
         """Ensure max pool size is greater than min pool size."""
-        min_size = values.get('min_pool_size', 1)
-        if v <= min_size:
+        if self.max_pool_size <= self.min_pool_size:
             raise ValueError("max_pool_size must be greater than min_pool_size")
-        return v
+        return self
 
 
-class DatabaseConfig(BaseConfig):
+class DatabaseConfig(FrozenConfig):
     """Main database configuration."""
     
-    environment: Environment = Field(
+    environment: Environment = config_field(
         default=Environment.DEVELOPMENT,
         description="Application environment"
     )
     
     # Component configurations
-    firestore: FirestoreConfig = Field(default_factory=FirestoreConfig)
-    redis: RedisConfig = Field(default_factory=RedisConfig)
-    pool: DatabasePoolConfig = Field(default_factory=DatabasePoolConfig)
+    firestore: FirestoreConfig = config_field(default_factory=FirestoreConfig)
+    redis: RedisConfig = config_field(default_factory=RedisConfig)
+    pool: DatabasePoolConfig = config_field(default_factory=DatabasePoolConfig)
     
     # Feature flags
-    enable_firestore: bool = Field(
+    enable_firestore: bool = config_field(
         default=True,
         description="Enable Firestore connections"
     )
     
-    enable_redis: bool = Field(
+    enable_redis: bool = config_field(
         default=True,
         description="Enable Redis connections"
     )
     
-    enable_connection_pooling: bool = Field(
+    enable_connection_pooling: bool = config_field(
         default=True,
         description="Enable connection pooling"
     )
     
     # Migration settings
-    auto_migrate: bool = Field(
+    auto_migrate: bool = config_field(
         default=False,
         description="Automatically run database migrations on startup"
     )
     
-    migration_timeout: int = Field(
+    migration_timeout: int = config_field(
         default=300,  # 5 minutes
         description="Migration timeout in seconds",
         ge=60
     )
     
     # Backup settings
-    backup_enabled: bool = Field(
+    backup_enabled: bool = config_field(
         default=False,
         description="Enable automatic backups"
     )
     
-    backup_interval_hours: int = Field(
+    backup_interval_hours: int = config_field(
         default=24,
         description="Backup interval in hours",
         ge=1
     )
     
-    backup_retention_days: int = Field(
+    backup_retention_days: int = config_field(
         default=30,
         description="Backup retention period in days",
         ge=1
     )
     
-    def get_firestore_client_config(self) -> Dict[str, Any]:
-        """Get Firestore client configuration."""
+    # The config is frozen, so the client configs are built on first access and
+    # shared read-only; the get_*_client_config() methods hand out mutable copies.
+    @cached_property
+    def firestore_client_config(self) -> Mapping[str, Any]:
+        firestore = self.firestore
+        config = {"project": firestore.project_id, "database": firestore.database_id}
+        if firestore.credentials_path:
+            config["credentials_path"] = firestore.credentials_path
+        if firestore.use_emulator and firestore.emulator_host:
+            config["emulator_host"] = firestore.emulator_host
+        return MappingProxyType(config)
+    
+    @cached_property
+    def redis_client_config(self) -> Mapping[str, Any]:
+        redis = self.redis
         config = {
-            "project": self.firestore.project_id,
-            "database": self.firestore.database_id,
+            "host": redis.host,
+            "port": redis.port,
+            "db": redis.database,
+            "socket_timeout": redis.socket_timeout,
+            "socket_connect_timeout": redis.connection_timeout,
+            "retry_on_timeout": redis.retry_on_timeout,
+            "max_connections": redis.max_connections,
         }
-        
-        if self.firestore.credentials_path:
-            config["credentials_path"] = self.firestore.credentials_path
-        
-        if self.firestore.use_emulator and self.firestore.emulator_host:
-            config["emulator_host"] = self.firestore.emulator_host
-        
-        return config
+        if redis.password:
+            config["password"] = redis.password
+        if redis.username:
+            config["username"] = redis.username
+        return MappingProxyType(config)
+    
+    def get_firestore_client_config(self) -> Dict[str, Any]:
+        """Get Firestore client configuration."""
+        return dict(self.firestore_client_config)
     
     def get_redis_client_config(self) -> Dict[str, Any]:
         """Get Redis client configuration."""
-        config = {
-            "host": self.redis.host,
-            "port": self.redis.port,
-            "db": self.redis.database,
-            "socket_timeout": self.redis.socket_timeout,
-            "socket_connect_timeout": self.redis.connection_timeout,
-            "retry_on_timeout": self.redis.retry_on_timeout,
-            "max_connections": self.redis.max_connections,
-        }
-        
-        if self.redis.password:
-            config["password"] = self.redis.password
-        
-        if self.redis.username:
-            config["username"] = self.redis.username
-        
-        return config
+        return dict(self.redis_client_config)
     
     def is_production_ready(self) -> bool:
         """Check if database configuration is ready for production."""
-        if self.environment != Environment.PRODUCTION:
+        return self._production_ready
+    
+    @cached_property
+    def _production_ready(self) -> bool:
+        # Cheap boolean checks come before string comparisons
+        if self.environment is not Environment.PRODUCTION:
             return True
         
         # Check Firestore settings
@@ -339,106 +355,117 @@ class DatabaseConfig(BaseConfig):
         
         # Check Redis settings
         if self.enable_redis:
-            if self.redis.url == "redis://localhost:6379":
+            if not self.redis.password:
                 return False
-            if not self.redis.password and self.environment == Environment.PRODUCTION:
+            if self.redis.url == "redis://localhost:6379":
                 return False
         
         return True
 
 
-# Configuration factories
-def get_database_config() -> DatabaseConfig:
+# Configuration factories. Each is cached so the validated models are built once
+# per process; call ``<factory>.cache_clear()`` to rebuild them.
+@lru_cache(maxsize=len(Environment))
+def get_database_config(environment: Environment = Environment.DEVELOPMENT) -> DatabaseConfig:
     """Get database configuration from environment variables."""
-    return DatabaseConfig()
+    return DatabaseConfig(environment=environment)
 
 
+@lru_cache(maxsize=1)
 def get_firestore_config() -> FirestoreConfig:
     """Get Firestore configuration from environment variables."""
     return FirestoreConfig()
 
 
+@lru_cache(maxsize=1)
 def get_redis_config() -> RedisConfig:
     """Get Redis configuration from environment variables."""
     return RedisConfig()
 
 
 # Environment-specific configurations
+@lru_cache(maxsize=1)
 def get_development_config() -> DatabaseConfig:
     """Get development database configuration."""
-    config = DatabaseConfig(environment=Environment.DEVELOPMENT)
-    
-    # Use emulator for development
-    config.firestore.use_emulator = True
-    config.firestore.emulator_host = "localhost:8080"
-    config.firestore.project_id = "webapp-factory-dev"
-    
-    # Local Redis
-    config.redis.url = "redis://localhost:6379"
-    config.redis.database = 0
-    
-    return config
+    return DatabaseConfig(
+        environment=Environment.DEVELOPMENT,
+        # Use emulator for development
+        firestore=FirestoreConfig(
+            use_emulator=True,
+            emulator_host="localhost:8080",
+            project_id="webapp-factory-dev",
+        ),
+        # Local Redis
+        redis=RedisConfig(url="redis://localhost:6379", database=0),
+    )
 
 
+@lru_cache(maxsize=1)
 def get_testing_config() -> DatabaseConfig:
     """Get testing database configuration."""
-    config = DatabaseConfig(environment=Environment.TESTING)
-    
-    # Use emulator for testing
-    config.firestore.use_emulator = True
-    config.firestore.emulator_host = "localhost:8080"
-    config.firestore.project_id = "webapp-factory-test"
-    
-    # Separate Redis database for tests
-    config.redis.url = "redis://localhost:6379"
-    config.redis.database = 1  # Use different database
-    
-    # Shorter TTLs for testing
-    config.redis.default_ttl = 300  # 5 minutes
-    config.redis.session_ttl = 600  # 10 minutes
-    
-    return config
+    return DatabaseConfig(
+        environment=Environment.TESTING,
+        # Use emulator for testing
+        firestore=FirestoreConfig(
+            use_emulator=True,
+            emulator_host="localhost:8080",
+            project_id="webapp-factory-test",
+        ),
+        # Separate Redis database for tests, with shorter TTLs
+        redis=RedisConfig(
+            url="redis://localhost:6379",
+            database=1,  # Use different database
+            default_ttl=300,  # 5 minutes
+            session_ttl=600,  # 10 minutes
+        ),
+    )
 
 
+@lru_cache(maxsize=1)
 def get_production_config() -> DatabaseConfig:
     """Get production database configuration template."""
-    config = DatabaseConfig(environment=Environment.PRODUCTION)
-    
-    # Production Firestore
-    config.firestore.use_emulator = False
-    config.firestore.project_id = "webapp-factory-prod"  # Override via env vars
-    
-    # Production Redis
-    config.redis.url = "redis://prod-redis:6379"  # Override via env vars
-    config.redis.database = 0
-    
-    # Enable backups
-    config.backup_enabled = True
-    config.backup_interval_hours = 12
-    config.backup_retention_days = 90
-    
-    return config
+    return DatabaseConfig(
+        environment=Environment.PRODUCTION,
+        # Production Firestore
+        firestore=FirestoreConfig(
+            use_emulator=False,
+            project_id="webapp-factory-prod",  # Override via env vars
+        ),
+        # Production Redis
+        redis=RedisConfig(
+            url="redis://prod-redis:6379",  # Override via env vars
+            database=0,
+        ),
+        # Enable backups
+        backup_enabled=True,
+        backup_interval_hours=12,
+        backup_retention_days=90,
+    )
+
+
+# Configuration validation: (check, message) pairs
+_DatabaseRule = Tuple[Callable[[DatabaseConfig], bool], str]
+
+_DATABASE_RULES: Tuple[_DatabaseRule, ...] = (
+    (
+        lambda c: c.enable_redis and not c.redis.password and c.environment in (Environment.STAGING, Environment.PRODUCTION),
+        "Redis password should be set in staging/production",
+    ),
+)
+
+# Production configs get their own checks plus the shared ones
+_DATABASE_PRODUCTION_RULES: Tuple[_DatabaseRule, ...] = (
+    (lambda c: not c.is_production_ready(), "Database configuration is not production ready"),
+    (lambda c: c.firestore.use_emulator, "Firestore emulator should not be used in production"),
+    (lambda c: c.redis.url == "redis://localhost:6379", "Redis URL should be configured for production"),
+    (lambda c: not c.backup_enabled, "Consider enabling backups in production"),
+) + _DATABASE_RULES
 
 
-# Configuration validation
 def validate_database_config(config: DatabaseConfig) -> List[str]:
     """Validate database configuration and return list of issues."""
-    issues = []
-    
-    if config.environment == Environment.PRODUCTION:
-        if not config.is_production_ready():
-            issues.append("Database configuration is not production ready")
-        
-        if config.firestore.use_emulator:
-            issues.append("Firestore emulator should not be used in production")
-        
-        if config.redis.url == "redis://localhost:6379":
-            issues.append("Redis URL should be configured for production")
-        
-        if not config.backup_enabled:
-            issues.append("Consider enabling backups in production")
-    
-    if config.enable_redis and not config.redis.password and config.environment in [Environment.STAGING, Environment.PRODUCTION]:
-        issues.append("Redis password should be set in staging/production")
-    
-    return issues
\ No newline at end of file
+    if config.environment is Environment.PRODUCTION:
+        rules = _DATABASE_PRODUCTION_RULES
+    else:
+        rules = _DATABASE_RULES
+    return [message for check, message in rules if check(config)]
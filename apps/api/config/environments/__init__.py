@@ -7,9 +7,20 @@ This package provides pre-configured settings for different deployment environme
 - Production: Secure production deployment
 """
 
-from .development import get_development_config, write_development_env_file
-from .testing import get_testing_config, write_testing_env_file
-from .production import get_production_config, write_production_env_file, validate_production_config
+import importlib
+from typing import Any
+
+# Submodules are imported on first attribute access (PEP 562) so using one
+# environment does not import and build the config models of the others.
+_MAP = {
+    "get_development_config": "development",
+    "write_development_env_file": "development",
+    "get_testing_config": "testing",
+    "write_testing_env_file": "testing",
+    "get_production_config": "production",
+    "write_production_env_file": "production",
+    "validate_production_config": "production",
+}
 
 __all__ = [
     "get_development_config",
@@ -19,4 +30,18 @@ __all__ = [
     "write_testing_env_file",
     "write_production_env_file",
     "validate_production_config",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _MAP[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __package__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -8,6 +8,11 @@ This configuration is optimized for local development with:
 - Enhanced debugging features
 """
 
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping
+
 from config.auth import AuthConfig, JWTConfig, SecurityPolicyConfig
 from config.database import DatabaseConfig, get_development_config as get_dev_db_config
 from config.features import FeatureFlagsConfig, get_development_flags_config
@@ -15,50 +20,58 @@ from config.logging import LoggingConfig, get_development_logging_config
 from config.base import Environment
 
 
-def get_development_config() -> dict:
-    """Get complete development configuration."""
+@lru_cache(maxsize=1)
+def get_development_config() -> Mapping[str, Any]:
+    """
+    Get complete development configuration.
+
+    Built once per process and shared between callers, so the mapping is
+    read-only; use ``dict(...)`` to get a copy that can be changed.
+    """
     
     # Authentication configuration
-    auth_config = AuthConfig(environment=Environment.DEVELOPMENT)
-    
-    # JWT settings for development
-    auth_config.jwt = JWTConfig(
-        secret_key="dev-secret-key-not-for-production-use-only",
-        algorithm="HS256",
-        access_token_expire_minutes=60,  # Longer expiration for dev
-        refresh_token_expire_days=7,
-        issuer="webapp-factory-dev",
-        audience="webapp-factory-dev-app"
-    )
-    
-    # Relaxed security for development
-    auth_config.security_policy = SecurityPolicyConfig(
-        min_password_length=6,  # Minimum allowed by SecurityPolicyConfig validator
-        require_password_uppercase=False,
-        require_password_lowercase=False,
-        require_password_numbers=False,
-        max_login_attempts=10,  # More attempts for dev
-        lockout_duration_minutes=5,  # Shorter lockout
-        mfa_enabled=False,
-        mfa_required_for_admin=False
+    auth_config = AuthConfig(
+        environment=Environment.DEVELOPMENT,
+        
+        # JWT settings for development
+        jwt=JWTConfig(
+            secret_key="dev-secret-key-not-for-production-use-only",
+            algorithm="HS256",
+            access_token_expire_minutes=60,  # Longer expiration for dev
+            refresh_token_expire_days=7,
+            issuer="webapp-factory-dev",
+            audience="webapp-factory-dev-app"
+        ),
+        
+        # Relaxed security for development
+        security_policy=SecurityPolicyConfig(
+            min_password_length=6,  # Minimum allowed by SecurityPolicyConfig validator
+            require_password_uppercase=False,
+            require_password_lowercase=False,
+            require_password_numbers=False,
+            max_login_attempts=10,  # More attempts for dev
+            lockout_duration_minutes=5,  # Shorter lockout
+            mfa_enabled=False,
+            mfa_required_for_admin=False
+        ),
+        
+        # Development OAuth settings
+        oauth_redirect_uri="http://127.0.0.1:5173/auth/callback",
+        cors_origins=[
+            "http://localhost:3000",
+            "http://127.0.0.1:5173",
+            "http://localhost:8080",
+            "http://localhost:8000",  # API docs
+        ],
+        
+        # Cookie settings for localhost
+        cookie_domain="localhost",
+        cookie_secure=False,
+        cookie_httponly=True,
+        cookie_samesite="lax",
     )
     
-    # Development OAuth settings
-    auth_config.oauth_redirect_uri = "http://127.0.0.1:5173/auth/callback"
-    auth_config.cors_origins = [
-        "http://localhost:3000",
-        "http://127.0.0.1:5173",
-        "http://localhost:8080",
-        "http://localhost:8000",  # API docs
-    ]
-    
-    # Cookie settings for localhost
-    auth_config.cookie_domain = "localhost"
-    auth_config.cookie_secure = False
-    auth_config.cookie_httponly = True
-    auth_config.cookie_samesite = "lax"
-    
-    return {
+    return MappingProxyType({
         "environment": Environment.DEVELOPMENT,
         "auth": auth_config,
         "database": get_dev_db_config(),
@@ -80,7 +93,7 @@ def get_development_config() -> dict:
         "api_port": 8000,
         "metrics_port": 8090,
         "debug_port": 5678,
-    }
+    })
 
 
 # Development environment variables template
@@ -136,7 +149,8 @@ APP_API_DOCS_ENABLED=true
 APP_PROFILING_ENABLED=true
 """
 
+_DEV_ENV_TEMPLATE_BYTES = DEVELOPMENT_ENV_TEMPLATE.strip().encode()
+
 def write_development_env_file(path: str = ".env.development") -> None:
     """Write development environment template to file."""
-    with open(path, "w") as f:
-        f.write(DEVELOPMENT_ENV_TEMPLATE.strip())
\ No newline at end of file
+    Path(path).write_bytes(_DEV_ENV_TEMPLATE_BYTES)
\ No newline at end of file
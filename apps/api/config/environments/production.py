@@ -8,6 +8,12 @@ This configuration is optimized for production deployment with:
 - Secure defaults
 """
 
+import os
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Tuple
+
 from config.auth import AuthConfig, JWTConfig, SecurityPolicyConfig, GoogleOAuthConfig
 from config.database import DatabaseConfig, get_production_config as get_prod_db_config
 from config.features import FeatureFlagsConfig, get_production_flags_config
@@ -15,58 +21,75 @@ from config.logging import LoggingConfig, get_production_logging_config
 from config.base import Environment
 
 
-def get_production_config() -> dict:
-    """Get complete production configuration."""
+# Placeholder values that must be replaced via environment variables. The same
+# interned objects flow into get_production_config(), so the `==` checks below
+# hit CPython's identity fast path; equal strings from overrides still match.
+_PLACEHOLDER_JWT_SECRET = sys.intern("CHANGE-THIS-IN-PRODUCTION-VIA-ENV-VARS")
+_PLACEHOLDER_GOOGLE_CLIENT_ID = sys.intern("GOOGLE_CLIENT_ID_FROM_ENV")
+_PLACEHOLDER_GOOGLE_CLIENT_SECRET = sys.intern("GOOGLE_CLIENT_SECRET_FROM_ENV")
+_PLACEHOLDER_DOMAIN = "yourdomain.com"
+
+
+@lru_cache(maxsize=1)
+def get_production_config() -> Mapping[str, Any]:
+    """
+    Get complete production configuration.
+
+    Built once per process and shared between callers, so the mapping is
+    read-only; use ``dict(...)`` to get a copy that can be changed.
+    """
     
     # Authentication configuration
-    auth_config = AuthConfig(environment=Environment.PRODUCTION)
-    
-    # JWT settings for production - these MUST be overridden via environment variables
-    auth_config.jwt = JWTConfig(
-        secret_key="CHANGE-THIS-IN-PRODUCTION-VIA-ENV-VARS",  # Must be overridden
-        algorithm="HS256",
-        access_token_expire_minutes=15,  # Short expiration for security
-        refresh_token_expire_days=30,
-        issuer="webapp-factory-api",
-        audience="webapp-factory-app"
-    )
-    
-    # Production security settings
-    auth_config.security_policy = SecurityPolicyConfig(
-        min_password_length=12,
-        require_password_uppercase=True,
-        require_password_lowercase=True,
-        require_password_numbers=True,
-        require_password_special_chars=True,
-        max_login_attempts=3,
-        lockout_duration_minutes=30,
-        mfa_enabled=True,
-        mfa_required_for_admin=True,
-        max_sessions_per_user=3,
-        session_timeout_minutes=30
-    )
-    
-    # Production OAuth settings - must be configured via env vars
-    auth_config.google_oauth = GoogleOAuthConfig(
-        client_id="GOOGLE_CLIENT_ID_FROM_ENV",  # Must be overridden
-        client_secret="GOOGLE_CLIENT_SECRET_FROM_ENV",  # Must be overridden
+    auth_config = AuthConfig(
+        environment=Environment.PRODUCTION,
+        
+        # JWT settings for production - these MUST be overridden via environment variables
+        jwt=JWTConfig(
+            secret_key=_PLACEHOLDER_JWT_SECRET,  # Must be overridden
+            algorithm="HS256",
+            access_token_expire_minutes=15,  # Short expiration for security
+            refresh_token_expire_days=30,
+            issuer="webapp-factory-api",
+            audience="webapp-factory-app"
+        ),
+        
+        # Production security settings
+        security_policy=SecurityPolicyConfig(
+            min_password_length=12,
+            require_password_uppercase=True,
+            require_password_lowercase=True,
+            require_password_numbers=True,
+            require_password_special_chars=True,
+            max_login_attempts=3,
+            lockout_duration_minutes=30,
+            mfa_enabled=True,
+            mfa_required_for_admin=True,
+            max_sessions_per_user=3,
+            session_timeout_minutes=30
+        ),
+        
+        # Production OAuth settings - must be configured via env vars
+        google_oauth=GoogleOAuthConfig(
+            client_id=_PLACEHOLDER_GOOGLE_CLIENT_ID,  # Must be overridden
+            client_secret=_PLACEHOLDER_GOOGLE_CLIENT_SECRET,  # Must be overridden
+        ),
+        
+        # Production URLs - must be configured via env vars
+        oauth_redirect_uri="https://app.yourdomain.com/auth/callback",
+        cors_origins=[
+            "https://yourdomain.com",
+            "https://app.yourdomain.com",
+            "https://www.yourdomain.com",
+        ],
+        
+        # Secure cookie settings for production
+        cookie_domain="yourdomain.com",
+        cookie_secure=True,  # HTTPS only
+        cookie_httponly=True,
+        cookie_samesite="strict",
     )
     
-    # Production URLs - must be configured via env vars
-    auth_config.oauth_redirect_uri = "https://app.yourdomain.com/auth/callback"
-    auth_config.cors_origins = [
-        "https://yourdomain.com",
-        "https://app.yourdomain.com",
-        "https://www.yourdomain.com",
-    ]
-    
-    # Secure cookie settings for production
-    auth_config.cookie_domain = "yourdomain.com"
-    auth_config.cookie_secure = True  # HTTPS only
-    auth_config.cookie_httponly = True
-    auth_config.cookie_samesite = "strict"
-    
-    return {
+    return MappingProxyType({
         "environment": Environment.PRODUCTION,
         "auth": auth_config,
         "database": get_prod_db_config(),
@@ -106,7 +129,7 @@ def get_production_config() -> dict:
         # Backup and maintenance
         "backup_enabled": True,
         "maintenance_mode": False,
-    }
+    })
 
 
 # Production environment variables template
@@ -116,6 +139,9 @@ PRODUCTION_ENV_TEMPLATE = """
 
 # Environment
 APP_ENV=production
+# Set to 0 to skip startup config validation when CI runs
+# `scripts/config_manager.py validate production` instead
+APP_VALIDATE_CONFIG=1
 
 # API Settings
 APP_DEBUG=false
@@ -193,69 +219,63 @@ APP_BACKUP_INTERVAL_HOURS=12
 APP_BACKUP_RETENTION_DAYS=90
 """
 
+_PROD_ENV_TEMPLATE_BYTES = PRODUCTION_ENV_TEMPLATE.strip().encode()
+
 def write_production_env_file(path: str = ".env.production") -> None:
-    """Write production environment template to file."""
-    with open(path, "w") as f:
-        f.write(PRODUCTION_ENV_TEMPLATE.strip())
+    """Write production environment template to file (created owner-only, mode 0600)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    # The file object owns fd from here on and writes the template in full
+    with os.fdopen(fd, "wb") as fh:
+        fh.write(_PROD_ENV_TEMPLATE_BYTES)
 
 
-def validate_production_config(config: dict) -> list[str]:
+# (check, message) pairs; each check returns True when the issue is present
+_Rule = Tuple[Callable[[Any], bool], str]
+
+_AUTH_RULES: Tuple[_Rule, ...] = (
+    (lambda a: a.jwt.secret_key == _PLACEHOLDER_JWT_SECRET, "JWT secret key must be changed from default value"),
+    (lambda a: len(a.jwt.secret_key) < 64, "JWT secret key should be at least 64 characters for production"),
+    (lambda a: a.google_oauth is not None and a.google_oauth.client_id == _PLACEHOLDER_GOOGLE_CLIENT_ID,
+     "Google OAuth client ID must be configured"),
+    (lambda a: a.google_oauth is not None and a.google_oauth.client_secret == _PLACEHOLDER_GOOGLE_CLIENT_SECRET,
+     "Google OAuth client secret must be configured"),
+    (lambda a: not a.cookie_secure, "Secure cookies must be enabled in production"),
+    (lambda a: a.cookie_samesite != "strict", "Consider using 'strict' SameSite cookie policy in production"),
+)
+
+_URL_RULES: Tuple[_Rule, ...] = (  # checked against (api_base_url, frontend_base_url)
+    (lambda urls: not urls[0].startswith("https://"), "API base URL must use HTTPS in production"),
+    (lambda urls: not urls[1].startswith("https://"), "Frontend base URL must use HTTPS in production"),
+    (lambda urls: any(_PLACEHOLDER_DOMAIN in url for url in urls), "Default domain names must be changed for production"),
+)
+
+_DATABASE_RULES: Tuple[_Rule, ...] = (
+    (lambda d: d.firestore.use_emulator, "Firestore emulator should not be used in production"),
+    (lambda d: d.redis.url == "redis://localhost:6379", "Redis URL must be configured for production"),
+)
+
+_SECURITY_FEATURE_RULES: Tuple[_Rule, ...] = (
+    (lambda c: not c.get("hsts_enabled", False), "HSTS should be enabled in production"),
+    (lambda c: not c.get("rate_limiting_enabled", False), "Rate limiting should be enabled in production"),
+    (lambda c: c.get("api_docs_enabled", True), "API documentation should be disabled in production"),
+)
+
+
+def validate_production_config(config: Mapping[str, Any]) -> list[str]:
     """Validate production configuration for security and completeness."""
     issues = []
     
     auth_config = config.get("auth")
     if auth_config:
-        # Check JWT secret
-        if auth_config.jwt.secret_key == "CHANGE-THIS-IN-PRODUCTION-VIA-ENV-VARS":
-            issues.append("JWT secret key must be changed from default value")
-        
-        if len(auth_config.jwt.secret_key) < 64:
-            issues.append("JWT secret key should be at least 64 characters for production")
-        
-        # Check OAuth configuration
-        if auth_config.google_oauth:
-            if auth_config.google_oauth.client_id == "GOOGLE_CLIENT_ID_FROM_ENV":
-                issues.append("Google OAuth client ID must be configured")
-            if auth_config.google_oauth.client_secret == "GOOGLE_CLIENT_SECRET_FROM_ENV":
-                issues.append("Google OAuth client secret must be configured")
-        
-        # Check security settings
-        if not auth_config.cookie_secure:
-            issues.append("Secure cookies must be enabled in production")
-        
-        if auth_config.cookie_samesite != "strict":
-            issues.append("Consider using 'strict' SameSite cookie policy in production")
-    
-    # Check URLs
-    api_url = config.get("api_base_url", "")
-    frontend_url = config.get("frontend_base_url", "")
-    
-    if not api_url.startswith("https://"):
-        issues.append("API base URL must use HTTPS in production")
+        issues.extend(message for check, message in _AUTH_RULES if check(auth_config))
     
-    if not frontend_url.startswith("https://"):
-        issues.append("Frontend base URL must use HTTPS in production")
+    urls = (config.get("api_base_url", ""), config.get("frontend_base_url", ""))
+    issues.extend(message for check, message in _URL_RULES if check(urls))
     
-    if "yourdomain.com" in api_url or "yourdomain.com" in frontend_url:
-        issues.append("Default domain names must be changed for production")
-    
-    # Check database configuration
     db_config = config.get("database")
     if db_config:
-        if db_config.firestore.use_emulator:
-            issues.append("Firestore emulator should not be used in production")
-        
-        if db_config.redis.url == "redis://localhost:6379":
-            issues.append("Redis URL must be configured for production")
-    
-    # Check security features
-    if not config.get("hsts_enabled", False):
-        issues.append("HSTS should be enabled in production")
-    
-    if not config.get("rate_limiting_enabled", False):
-        issues.append("Rate limiting should be enabled in production")
+        issues.extend(message for check, message in _DATABASE_RULES if check(db_config))
     
-    if config.get("api_docs_enabled", True):
-        issues.append("API documentation should be disabled in production")
+    issues.extend(message for check, message in _SECURITY_FEATURE_RULES if check(config))
     
-    return issues
\ No newline at end of file
+    return issues
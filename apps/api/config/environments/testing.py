@@ -8,6 +8,11 @@ This configuration is optimized for automated testing with:
 - Isolated test data
 """
 
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping
+
 from config.auth import AuthConfig, JWTConfig, SecurityPolicyConfig
 from config.database import DatabaseConfig, get_testing_config as get_test_db_config
 from config.features import FeatureFlagsConfig, get_testing_flags_config
@@ -15,47 +20,55 @@ from config.logging import LoggingConfig, get_testing_logging_config
 from config.base import Environment
 
 
-def get_testing_config() -> dict:
-    """Get complete testing configuration."""
+@lru_cache(maxsize=1)
+def get_testing_config() -> Mapping[str, Any]:
+    """
+    Get complete testing configuration.
+
+    Built once per process and shared between callers, so the mapping is
+    read-only; use ``dict(...)`` to get a copy that can be changed.
+    """
     
     # Authentication configuration
-    auth_config = AuthConfig(environment=Environment.TESTING)
-    
-    # JWT settings for testing
-    auth_config.jwt = JWTConfig(
-        secret_key="test-secret-key-for-automated-testing-only",
-        algorithm="HS256",
-        access_token_expire_minutes=5,  # Short expiration for tests
-        refresh_token_expire_days=1,
-        issuer="webapp-factory-test",
-        audience="webapp-factory-test-app"
-    )
-    
-    # Minimal security requirements for tests
-    auth_config.security_policy = SecurityPolicyConfig(
-        min_password_length=6,
-        require_password_uppercase=False,
-        require_password_lowercase=False,
-        require_password_numbers=False,
-        max_login_attempts=3,
-        lockout_duration_minutes=1,
-        mfa_enabled=False,
-        mfa_required_for_admin=False,
-        max_sessions_per_user=10,
-        session_timeout_minutes=30
+    auth_config = AuthConfig(
+        environment=Environment.TESTING,
+        
+        # JWT settings for testing
+        jwt=JWTConfig(
+            secret_key="test-secret-key-for-automated-testing-only",
+            algorithm="HS256",
+            access_token_expire_minutes=5,  # Short expiration for tests
+            refresh_token_expire_days=1,
+            issuer="webapp-factory-test",
+            audience="webapp-factory-test-app"
+        ),
+        
+        # Minimal security requirements for tests
+        security_policy=SecurityPolicyConfig(
+            min_password_length=6,
+            require_password_uppercase=False,
+            require_password_lowercase=False,
+            require_password_numbers=False,
+            max_login_attempts=3,
+            lockout_duration_minutes=1,
+            mfa_enabled=False,
+            mfa_required_for_admin=False,
+            max_sessions_per_user=10,
+            session_timeout_minutes=30
+        ),
+        
+        # Test OAuth settings
+        oauth_redirect_uri="http://localhost:8000/auth/callback",
+        cors_origins=["http://localhost:8000"],
+        
+        # Test cookie settings
+        cookie_domain=None,
+        cookie_secure=False,
+        cookie_httponly=True,
+        cookie_samesite="lax",
     )
     
-    # Test OAuth settings
-    auth_config.oauth_redirect_uri = "http://localhost:8000/auth/callback"
-    auth_config.cors_origins = ["http://localhost:8000"]
-    
-    # Test cookie settings
-    auth_config.cookie_domain = None
-    auth_config.cookie_secure = False
-    auth_config.cookie_httponly = True
-    auth_config.cookie_samesite = "lax"
-    
-    return {
+    return MappingProxyType({
         "environment": Environment.TESTING,
         "auth": auth_config,
         "database": get_test_db_config(),
@@ -80,7 +93,7 @@ def get_testing_config() -> dict:
         # Test data isolation
         "test_database_suffix": "_test",
         "cleanup_after_tests": True,
-    }
+    })
 
 
 # Testing environment variables template
@@ -137,7 +150,8 @@ APP_PROFILING_ENABLED=false
 APP_CLEANUP_AFTER_TESTS=true
 """
 
+_TEST_ENV_TEMPLATE_BYTES = TESTING_ENV_TEMPLATE.strip().encode()
+
 def write_testing_env_file(path: str = ".env.testing") -> None:
     """Write testing environment template to file."""
-    with open(path, "w") as f:
-        f.write(TESTING_ENV_TEMPLATE.strip())
\ No newline at end of file
+    Path(path).write_bytes(_TEST_ENV_TEMPLATE_BYTES)
\ No newline at end of file
@@ -9,13 +9,21 @@ This module provides a comprehensive feature flag system for:
 - User/organization-specific features
 """
 
-from typing import Dict, List, Optional, Any, Union
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Any, Tuple
 from enum import Enum
 from datetime import datetime
-from pydantic import Field, validator
+from functools import lru_cache
+from types import MappingProxyType
+from pydantic import Field
 from .base import BaseConfig, Environment
 
 
+# Flag keys: ASCII letters, digits, underscores and hyphens
+_FLAG_KEY_RE = re.compile(r'\A[A-Za-z0-9_-]+\Z')
+
+
 class FeatureFlagStrategy(str, Enum):
     """Feature flag rollout strategies."""
     ALL = "all"  # Enable for all users
@@ -26,137 +34,124 @@ class FeatureFlagStrategy(str, Enum):
     GRADUAL = "gradual"  # Gradual rollout over time
 
 
-class FeatureFlagCondition(BaseConfig):
-    """Condition for feature flag evaluation."""
-    
-    # User-based conditions
-    user_ids: List[str] = Field(
-        default_factory=list,
-        description="Specific user IDs"
-    )
-    
-    user_roles: List[str] = Field(
-        default_factory=list,
-        description="User roles to match"
-    )
-    
-    user_plans: List[str] = Field(
-        default_factory=list,
-        description="User subscription plans to match"
-    )
-    
-    # Organization-based conditions
-    organization_ids: List[str] = Field(
-        default_factory=list,
-        description="Specific organization IDs"
-    )
-    
-    organization_plans: List[str] = Field(
-        default_factory=list,
-        description="Organization plans to match"
-    )
-    
-    # Environment conditions
-    environments: List[Environment] = Field(
-        default_factory=list,
-        description="Environments where this condition applies"
-    )
-    
-    # Time-based conditions
-    start_date: Optional[datetime] = Field(
-        default=None,
-        description="Start date for time-based rollout"
-    )
-    
-    end_date: Optional[datetime] = Field(
-        default=None,
-        description="End date for time-based rollout"
-    )
-    
-    # Custom attributes
-    custom_attributes: Dict[str, Union[str, int, bool, List[str]]] = Field(
-        default_factory=dict,
-        description="Custom attributes for condition matching"
-    )
+# Sequence fields normalized to tuples in FeatureFlagCondition.__post_init__
+_CONDITION_TUPLE_FIELDS = (
+    "user_ids",
+    "user_roles",
+    "user_plans",
+    "organization_ids",
+    "organization_plans",
+)
+
+
+@dataclass(slots=True, frozen=True)
+class FeatureFlagCondition:
+    """Condition for feature flag evaluation (read-only, like ``FeatureFlag``)."""
+    
+    # User-based conditions: specific user IDs, roles and subscription plans to match
+    user_ids: Tuple[str, ...] = ()
+    user_roles: Tuple[str, ...] = ()
+    user_plans: Tuple[str, ...] = ()
+    
+    # Organization-based conditions: specific organization IDs and plans to match
+    organization_ids: Tuple[str, ...] = ()
+    organization_plans: Tuple[str, ...] = ()
+    
+    # Environments where this condition applies
+    environments: Tuple[Environment, ...] = ()
+    
+    # Time-based rollout window
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    
+    # Custom attributes for condition matching
+    custom_attributes: Dict[str, Any] = field(default_factory=dict)
+    
+    def __post_init__(self):
+        for name in _CONDITION_TUPLE_FIELDS:
+            value = getattr(self, name)
+            if not isinstance(value, tuple):
+                object.__setattr__(self, name, tuple(value))
+        object.__setattr__(self, "environments", tuple(Environment(e) for e in self.environments))
+
 
+# Sequence fields normalized to tuples in FeatureFlag.__post_init__
+_FLAG_TUPLE_FIELDS = (
+    "whitelist_users",
+    "blacklist_users",
+    "whitelist_organizations",
+    "blacklist_organizations",
+    "depends_on",
+    "tags",
+)
 
-class FeatureFlag(BaseConfig):
-    """Individual feature flag configuration."""
+
+@dataclass(slots=True, frozen=True)
+class FeatureFlag:
+    """
+    Individual feature flag configuration.
+
+    Flags are read-only defaults shared between configs, so this is a frozen
+    slotted dataclass validated once in ``__post_init__`` rather than a
+    pydantic model. Pydantic still builds it from dicts and serializes it when
+    it appears in ``FeatureFlagsConfig``.
+    """
     
     # Basic properties
-    key: str = Field(description="Unique feature flag key")
-    name: str = Field(description="Human-readable name")
-    description: str = Field(description="Feature description")
+    key: str  # Unique feature flag key
+    name: str  # Human-readable name
+    description: str  # Feature description
     
     # Flag state
-    enabled: bool = Field(
-        default=False,
-        description="Whether the flag is enabled"
-    )
-    
-    strategy: FeatureFlagStrategy = Field(
-        default=FeatureFlagStrategy.NONE,
-        description="Rollout strategy"
-    )
+    enabled: bool = False
+    strategy: FeatureFlagStrategy = FeatureFlagStrategy.NONE
     
     # Rollout configuration
-    percentage: int = Field(
-        default=0,
-        description="Percentage of users to enable (0-100)",
-        ge=0,
-        le=100
-    )
-    
-    # Conditions
-    conditions: List[FeatureFlagCondition] = Field(
-        default_factory=list,
-        description="Conditions for flag evaluation"
-    )
-    
-    # Targeting
-    whitelist_users: List[str] = Field(
-        default_factory=list,
-        description="Users who always have this feature enabled"
-    )
-    
-    blacklist_users: List[str] = Field(
-        default_factory=list,
-        description="Users who never have this feature enabled"
-    )
+    percentage: int = 0  # Percentage of users to enable (0-100)
     
-    whitelist_organizations: List[str] = Field(
-        default_factory=list,
-        description="Organizations that always have this feature enabled"
-    )
+    # Conditions for flag evaluation
+    conditions: Tuple[FeatureFlagCondition, ...] = ()
     
-    blacklist_organizations: List[str] = Field(
-        default_factory=list,
-        description="Organizations that never have this feature enabled"
-    )
+    # Targeting: users/organizations that always (whitelist) or never (blacklist) get the feature
+    whitelist_users: Tuple[str, ...] = ()
+    blacklist_users: Tuple[str, ...] = ()
+    whitelist_organizations: Tuple[str, ...] = ()
+    blacklist_organizations: Tuple[str, ...] = ()
     
     # Metadata
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
-    created_by: Optional[str] = Field(default=None, description="User who created the flag")
-    
-    # Dependencies
-    depends_on: List[str] = Field(
-        default_factory=list,
-        description="Other feature flags this flag depends on"
-    )
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+    created_by: Optional[str] = None  # User who created the flag
     
-    # Tags for organization
-    tags: List[str] = Field(
-        default_factory=list,
-        description="Tags for organizing flags"
-    )
+    # Other feature flags this flag depends on
+    depends_on: Tuple[str, ...] = ()
+    
+    # Tags for organizing flags
+    tags: Tuple[str, ...] = ()
     
-    @validator('key')
-    def validate_key(cls, v):
-        """Validate feature flag key format."""
-        if not v.replace('_', '').replace('-', '').isalnum():
+    def __post_init__(self):
+        # Built-in keys were validated once at import and are already lowercase
+        key = self.key
+        if not isinstance(key, str):
             raise ValueError("Feature flag key must be alphanumeric with underscores or hyphens")
-        return v.lower()
+        if key not in _DEFAULT_FLAG_KEYS:
+            if not _FLAG_KEY_RE.match(key):
+                raise ValueError("Feature flag key must be alphanumeric with underscores or hyphens")
+            object.__setattr__(self, "key", key.lower())
+        object.__setattr__(self, "strategy", FeatureFlagStrategy(self.strategy))
+        
+        if not 0 <= self.percentage <= 100:
+            raise ValueError("Feature flag percentage must be between 0 and 100")
+        
+        conditions = tuple(
+            c if isinstance(c, FeatureFlagCondition) else FeatureFlagCondition(**c)
+            for c in self.conditions
+        )
+        object.__setattr__(self, "conditions", conditions)
+        for name in _FLAG_TUPLE_FIELDS:
+            value = getattr(self, name)
+            if not isinstance(value, tuple):
+                object.__setattr__(self, name, tuple(value))
 
 
 class FeatureFlagsConfig(BaseConfig):
@@ -240,137 +235,145 @@ class FeatureFlagsConfig(BaseConfig):
         return False
 
 
-# Default feature flags for the application
-def create_default_flags() -> Dict[str, FeatureFlag]:
-    """Create default feature flags for the application."""
-    flags = {}
-    
+# Default feature flags for the application: (key, FeatureFlag kwargs)
+_DEFAULT_FLAG_SPECS: Tuple[Tuple[str, Dict[str, Any]], ...] = (
     # Authentication features
-    flags["oauth_login"] = FeatureFlag(
-        key="oauth_login",
+    ("oauth_login", dict(
         name="OAuth Login",
         description="Enable OAuth login with Google",
         enabled=True,
         strategy=FeatureFlagStrategy.ALL,
-        tags=["auth", "login"]
-    )
-    
-    flags["mfa_required"] = FeatureFlag(
-        key="mfa_required",
+        tags=("auth", "login"),
+    )),
+    ("mfa_required", dict(
         name="Multi-Factor Authentication",
         description="Require MFA for sensitive operations",
         enabled=False,
         strategy=FeatureFlagStrategy.WHITELIST,
-        whitelist_users=["admin"],
-        tags=["auth", "security"]
-    )
+        whitelist_users=("admin",),
+        tags=("auth", "security"),
+    )),
     
     # API features
-    flags["rate_limiting"] = FeatureFlag(
-        key="rate_limiting",
+    ("rate_limiting", dict(
         name="API Rate Limiting",
         description="Enable rate limiting for API endpoints",
         enabled=True,
         strategy=FeatureFlagStrategy.ALL,
-        tags=["api", "security"]
-    )
-    
-    flags["api_v2"] = FeatureFlag(
-        key="api_v2",
+        tags=("api", "security"),
+    )),
+    ("api_v2", dict(
         name="API v2 Endpoints",
         description="Enable new API v2 endpoints",
         enabled=False,
         strategy=FeatureFlagStrategy.PERCENTAGE,
         percentage=10,
-        tags=["api", "beta"]
-    )
+        tags=("api", "beta"),
+    )),
     
     # UI features
-    flags["new_dashboard"] = FeatureFlag(
-        key="new_dashboard",
+    ("new_dashboard", dict(
         name="New Dashboard UI",
         description="Enable the redesigned dashboard interface",
         enabled=False,
         strategy=FeatureFlagStrategy.PERCENTAGE,
         percentage=20,
-        tags=["ui", "dashboard", "beta"]
-    )
-    
-    flags["dark_mode"] = FeatureFlag(
-        key="dark_mode",
+        tags=("ui", "dashboard", "beta"),
+    )),
+    ("dark_mode", dict(
         name="Dark Mode",
         description="Enable dark mode theme",
         enabled=True,
         strategy=FeatureFlagStrategy.ALL,
-        tags=["ui", "theme"]
-    )
+        tags=("ui", "theme"),
+    )),
     
-    # Premium features
-    flags["advanced_analytics"] = FeatureFlag(
-        key="advanced_analytics",
+    # Premium features (conditions are built into FeatureFlagCondition by FeatureFlag)
+    ("advanced_analytics", dict(
         name="Advanced Analytics",
         description="Advanced analytics and reporting features",
         enabled=True,
         strategy=FeatureFlagStrategy.WHITELIST,
-        conditions=[
-            FeatureFlagCondition(
-                user_plans=["pro", "enterprise"],
-                organization_plans=["business", "enterprise"]
-            )
-        ],
-        tags=["premium", "analytics"]
-    )
-    
-    flags["export_data"] = FeatureFlag(
-        key="export_data",
+        conditions=(
+            {"user_plans": ["pro", "enterprise"], "organization_plans": ["business", "enterprise"]},
+        ),
+        tags=("premium", "analytics"),
+    )),
+    ("export_data", dict(
         name="Data Export",
         description="Export user data and reports",
         enabled=True,
         strategy=FeatureFlagStrategy.WHITELIST,
-        conditions=[
-            FeatureFlagCondition(
-                user_plans=["pro", "enterprise"]
-            )
-        ],
-        tags=["premium", "export"]
-    )
+        conditions=({"user_plans": ["pro", "enterprise"]},),
+        tags=("premium", "export"),
+    )),
     
     # Experimental features
-    flags["ai_suggestions"] = FeatureFlag(
-        key="ai_suggestions",
+    ("ai_suggestions", dict(
         name="AI Suggestions",
         description="AI-powered suggestions and recommendations",
         enabled=False,
         strategy=FeatureFlagStrategy.PERCENTAGE,
         percentage=5,
-        tags=["experimental", "ai", "beta"]
-    )
-    
-    flags["real_time_collaboration"] = FeatureFlag(
-        key="real_time_collaboration",
+        tags=("experimental", "ai", "beta"),
+    )),
+    ("real_time_collaboration", dict(
         name="Real-time Collaboration",
         description="Real-time collaborative editing features",
         enabled=False,
         strategy=FeatureFlagStrategy.WHITELIST,
-        whitelist_organizations=["test-org"],
-        tags=["experimental", "collaboration", "beta"]
-    )
-    
-    return flags
+        whitelist_organizations=("test-org",),
+        tags=("experimental", "collaboration", "beta"),
+    )),
+)
+
+
+# Validate the built-in keys in one pass so building the flags can skip the per-flag check
+_DEFAULT_FLAG_KEYS = frozenset(key for key, _ in _DEFAULT_FLAG_SPECS)
+_invalid_keys = [key for key in _DEFAULT_FLAG_KEYS if not _FLAG_KEY_RE.match(key) or key != key.lower()]
+if _invalid_keys:
+    raise ValueError(f"Invalid default feature flag keys: {', '.join(sorted(_invalid_keys))}")
+del _invalid_keys
+
+
+@lru_cache(maxsize=1)
+def create_default_flags() -> Mapping[str, FeatureFlag]:
+    """
+    Create default feature flags for the application.
+
+    Built once and shared: the returned mapping is read-only and the flags in it
+    are frozen. Use ``create_default_flags_copy()`` for a mutable mapping.
+    """
+    # One timestamp for the whole batch (datetime is immutable, so sharing is safe)
+    now = datetime.now()
+    return MappingProxyType({
+        key: FeatureFlag(key=key, created_at=now, updated_at=now, **spec)
+        for key, spec in _DEFAULT_FLAG_SPECS
+    })
+
+
+def create_default_flags_copy() -> Dict[str, FeatureFlag]:
+    """
+    Return the default feature flags as a new, mutable dict.
+
+    The flags themselves are frozen; use ``dataclasses.replace`` to derive a
+    modified flag and store it back under its key.
+    """
+    return dict(create_default_flags())
 
 
 # Configuration factories
 def get_feature_flags_config() -> FeatureFlagsConfig:
     """Get feature flags configuration from environment variables."""
     config = FeatureFlagsConfig()
-    config.default_flags = create_default_flags()
+    config.default_flags = dict(create_default_flags())
     return config
 
 
 def get_development_flags_config() -> FeatureFlagsConfig:
     """Get development feature flags configuration."""
     config = FeatureFlagsConfig(environment=Environment.DEVELOPMENT)
-    config.default_flags = create_default_flags()
+    config.default_flags = dict(create_default_flags())
     
     # Enable more experimental features in development
     config.storage_backend = "memory"
@@ -383,7 +386,7 @@ def get_development_flags_config() -> FeatureFlagsConfig:
 def get_testing_flags_config() -> FeatureFlagsConfig:
     """Get testing feature flags configuration."""
     config = FeatureFlagsConfig(environment=Environment.TESTING)
-    config.default_flags = create_default_flags()
+    config.default_flags = dict(create_default_flags())
     
     # Minimal flags for testing
     config.storage_backend = "memory"
@@ -397,7 +400,7 @@ def get_testing_flags_config() -> FeatureFlagsConfig:
 def get_production_flags_config() -> FeatureFlagsConfig:
     """Get production feature flags configuration."""
     config = FeatureFlagsConfig(environment=Environment.PRODUCTION)
-    config.default_flags = create_default_flags()
+    config.default_flags = dict(create_default_flags())
     
     # Production settings
     config.storage_backend = "firestore"  # Persistent storage
@@ -416,13 +419,11 @@ def validate_feature_flags_config(config: FeatureFlagsConfig) -> List[str]:
     issues = []
     
     # Check for flag dependency cycles
-    for flag_key, flag in config.default_flags.items():
-        visited = set()
-        if _has_circular_dependency(flag, config.default_flags, visited):
-            issues.append(f"Circular dependency detected for flag: {flag_key}")
+    for cycle in _find_cycles(config.default_flags):
+        issues.append(f"Circular dependency detected between flags: {', '.join(cycle)}")
     
     # Production checks
-    if config.environment == Environment.PRODUCTION:
+    if config.environment is Environment.PRODUCTION:
         if config.storage_backend == "memory":
             issues.append("Memory storage not recommended for production")
         
@@ -432,18 +433,58 @@ def validate_feature_flags_config(config: FeatureFlagsConfig) -> List[str]:
     return issues
 
 
-def _has_circular_dependency(flag: FeatureFlag, all_flags: Dict[str, FeatureFlag], visited: set) -> bool:
-    """Check for circular dependencies in feature flags."""
-    if flag.key in visited:
-        return True
-    
-    visited.add(flag.key)
-    
-    for dep_key in flag.depends_on:
-        if dep_key in all_flags:
-            dep_flag = all_flags[dep_key]
-            if _has_circular_dependency(dep_flag, all_flags, visited):
-                return True
-    
-    visited.remove(flag.key)
-    return False
\ No newline at end of file
+def _find_cycles(flags: Mapping[str, FeatureFlag]) -> List[List[str]]:
+    """
+    Find dependency cycles among feature flags.
+
+    Runs Tarjan's strongly connected components algorithm once over the
+    ``depends_on`` graph (iteratively, so deep chains can't hit the recursion
+    limit) and returns each cycle as a list of flag keys. Dependencies on
+    unknown flags are ignored.
+    """
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    stack: List[str] = []
+    on_stack: set = set()
+    cycles: List[List[str]] = []
+    
+    for root in flags:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(flags[root].depends_on))]
+        
+        while work:
+            node, deps = work[-1]
+            for dep in deps:
+                if dep not in flags:
+                    continue
+                if dep not in index:
+                    index[dep] = lowlink[dep] = len(index)
+                    stack.append(dep)
+                    on_stack.add(dep)
+                    work.append((dep, iter(flags[dep].depends_on)))
+                    break
+                if dep in on_stack:
+                    lowlink[node] = min(lowlink[node], index[dep])
+            else:
+                # All dependencies of node visited
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in flags[node].depends_on:
+                        component.reverse()
+                        cycles.append(component)
+    
+    return cycles
@@ -12,13 +12,19 @@ Usage:
 """
 
 import os
+from functools import lru_cache
 from typing import Optional
 from pydantic import BaseModel, Field
 
+from .base import env_snapshot
+
 
 class GoogleOAuthConfig(BaseModel):
     """Google OAuth configuration"""
     
+    # Shared through the get_google_oauth_config() cache, so read-only
+    model_config = {"frozen": True}
+    
     client_id: str = Field(
         description="Google OAuth client ID"
     )
@@ -53,6 +59,7 @@ class GoogleOAuthConfig(BaseModel):
     )
 
 
+@lru_cache(maxsize=1)
 def get_google_oauth_config() -> GoogleOAuthConfig:
     """
     Get Google OAuth configuration from environment or settings.
@@ -62,18 +69,26 @@ def get_google_oauth_config() -> GoogleOAuthConfig:
     2. Plain environment variables (GOOGLE_CLIENT_ID, etc.)
     3. Settings object
     
+    The configuration is read once per process; call
+    ``get_google_oauth_config.cache_clear()`` to re-read it.
+    
     Returns:
         GoogleOAuthConfig instance
         
     Raises:
         ValueError: If required configuration is missing
     """
+    # Local import keeps this module importable without the api package; the cache means it runs once
     from ..settings import settings
     
+    # APP_* variables come from the shared snapshot; the unprefixed fallbacks
+    # are read from os.environ directly
+    env = env_snapshot()
+    
     # Get client ID
     client_id = (
-        os.getenv("APP_GOOGLE_CLIENT_ID")
-        or os.getenv("GOOGLE_CLIENT_ID")
+        env.get("APP_GOOGLE_CLIENT_ID")
+        or os.environ.get("GOOGLE_CLIENT_ID")
         or getattr(settings, "GOOGLE_CLIENT_ID", None)
     )
     
@@ -85,8 +100,8 @@ def get_google_oauth_config() -> GoogleOAuthConfig:
     
     # Get client secret
     client_secret = (
-        os.getenv("APP_GOOGLE_CLIENT_SECRET")
-        or os.getenv("GOOGLE_CLIENT_SECRET")
+        env.get("APP_GOOGLE_CLIENT_SECRET")
+        or os.environ.get("GOOGLE_CLIENT_SECRET")
         or getattr(settings, "GOOGLE_CLIENT_SECRET", None)
     )
     
@@ -98,17 +113,17 @@ def get_google_oauth_config() -> GoogleOAuthConfig:
     
     # Get optional settings
     workspace_domain = (
-        os.getenv("APP_GOOGLE_WORKSPACE_DOMAIN")
-        or os.getenv("GOOGLE_WORKSPACE_DOMAIN")
+        env.get("APP_GOOGLE_WORKSPACE_DOMAIN")
+        or os.environ.get("GOOGLE_WORKSPACE_DOMAIN")
     )
     
     refresh_token_key = (
-        os.getenv("APP_REFRESH_TOKEN_KEY")
-        or os.getenv("REFRESH_TOKEN_KEY")
+        env.get("APP_REFRESH_TOKEN_KEY")
+        or os.environ.get("REFRESH_TOKEN_KEY")
     )
     
     # Scopes (comma-separated in env)
-    scopes_str = os.getenv("APP_GOOGLE_OAUTH_SCOPES")
+    scopes_str = env.get("APP_GOOGLE_OAUTH_SCOPES")
     if scopes_str:
         scopes = [s.strip() for s in scopes_str.split(",")]
     else:
@@ -123,10 +138,14 @@ def get_google_oauth_config() -> GoogleOAuthConfig:
     )
 
 
+@lru_cache(maxsize=1)
 def validate_production_config() -> bool:
     """
     Validate that required configuration for production is present.
     
+    A successful result is cached (failures raise and are re-checked on the
+    next call); ``validate_production_config.cache_clear()`` forces a re-check.
+    
     Returns:
         True if valid, raises ValueError if invalid
     """
@@ -134,20 +153,26 @@ def validate_production_config() -> bool:
     
     config = get_google_oauth_config()
     
+    # The remaining checks only apply to production
+    if settings.ENV != "production":
+        return True
+    
     # Check refresh token key in production
-    if settings.ENV == "production" and not config.refresh_token_key:
+    if not config.refresh_token_key:
         raise ValueError(
             "Production environment requires APP_REFRESH_TOKEN_KEY to be set. "
             "Generate one with: python -c \"from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())\""
         )
     
-    # Check HTTPS requirement for production
+    # Check HTTPS requirement for production (stops at the first plain-HTTP origin)
     cors_origins = getattr(settings, "cors_origins", [])
-    if settings.ENV == "production":
-        for origin in cors_origins:
-            if origin.startswith("http://") and not origin.startswith("http://localhost"):
-                raise ValueError(
-                    f"Production environment should use HTTPS origins only. Found: {origin}"
-                )
+    insecure = next(
+        (o for o in cors_origins if o.startswith("http://") and not o.startswith("http://localhost")),
+        None,
+    )
+    if insecure is not None:
+        raise ValueError(
+            f"Production environment should use HTTPS origins only. Found: {insecure}"
+        )
     
     return True
@@ -5,60 +5,87 @@ This module allows loading configuration from JSON files in addition to
 environment variables and Python configuration files.
 """
 
-import json
+import hashlib
+import logging
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, FrozenSet, Mapping, Optional, Tuple
+
+import orjson
+from pydantic_core import from_json
 
 from config.auth import AuthConfig, JWTConfig, SecurityPolicyConfig, GoogleOAuthConfig
 from config.database import DatabaseConfig, FirestoreConfig, RedisConfig
-from config.features import FeatureFlagsConfig, FeatureFlag, FeatureFlagStrategy
+from config.features import FeatureFlagsConfig
 from config.logging import LoggingConfig, LogHandler, LogLevel, LogFormat
-from config.base import Environment
+from config.base import Environment, env_snapshot
+
+logger = logging.getLogger("uvicorn.error")
+
+
+# Match ${VAR} or ${VAR:-default}
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
+
+@lru_cache(maxsize=4096)
+def _compile_template(value: str) -> Tuple[Tuple[Tuple[str, str, str], ...], str]:
+    # Split a string once into (literal, var name, fallback) segments plus the
+    # trailing literal; reloads of the same config reuse the parsed form.
+    # Without a ':-' default the fallback is the placeholder itself, so unset
+    # variables are left as-is.
+    segments = []
+    pos = 0
+    for match in _ENV_VAR_RE.finditer(value):
+        var_expr = match.group(1)
+        if ':-' in var_expr:
+            var_name, default_value = var_expr.split(':-', 1)
+            segments.append((value[pos:match.start()], var_name.strip(), default_value.strip()))
+        else:
+            segments.append((value[pos:match.start()], var_expr.strip(), match.group(0)))
+        pos = match.end()
+    return tuple(segments), value[pos:]
+
+
+def _expand_string(value: str) -> str:
+    segments, tail = _compile_template(value)
+    environ = os.environ
+    return "".join([literal + environ.get(name, default) for literal, name, default in segments]) + tail
 
 
 def expand_env_vars(value: Any) -> Any:
     """
-    Recursively expand environment variables in strings.
+    Expand environment variables in strings, walking nested dicts and lists.
     Supports ${VAR} and ${VAR:-default} syntax.
+
+    Containers are updated in place (only strings with a placeholder are
+    replaced) and the same object is returned.
     """
     if isinstance(value, str):
-        # Match ${VAR} or ${VAR:-default}
-        def replacer(match):
-            var_expr = match.group(1)
-            if ':-' in var_expr:
-                var_name, default_value = var_expr.split(':-', 1)
-                return os.getenv(var_name.strip(), default_value.strip())
-            else:
-                return os.getenv(var_expr.strip(), match.group(0))
-        
-        return re.sub(r'\$\{([^}]+)\}', replacer, value)
-    elif isinstance(value, dict):
-        return {k: expand_env_vars(v) for k, v in value.items()}
-    elif isinstance(value, list):
-        return [expand_env_vars(item) for item in value]
-    else:
-        return value
-
-
-def load_json_config(config_path: str) -> Dict[str, Any]:
-    """Load configuration from JSON file and expand environment variables."""
-    path = Path(config_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
-    
-    with open(path, 'r') as f:
-        raw_config = json.load(f)
+        # Most strings have no placeholder; skip the regex engine for them
+        if '${' not in value:
+            return value
+        return _expand_string(value)
     
-    # Expand environment variables
-    return expand_env_vars(raw_config)
-    elif isinstance(value, dict):
-        return {k: expand_env_vars(v) for k, v in value.items()}
-    elif isinstance(value, list):
-        return [expand_env_vars(item) for item in value]
-    else:
-        return value
+    # Iterative walk with an explicit stack: no recursion and no copies of
+    # branches that contain nothing to substitute
+    stack = [value]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            items = node.items()
+        elif isinstance(node, list):
+            items = enumerate(node)
+        else:
+            continue
+        for key, item in items:
+            if isinstance(item, str):
+                if '${' in item:
+                    node[key] = _expand_string(item)
+            elif isinstance(item, (dict, list)):
+                stack.append(item)
+    return value
 
 
 def load_json_config(config_path: str) -> Dict[str, Any]:
@@ -67,39 +94,24 @@ def load_json_config(config_path: str) -> Dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
     
-    with open(path, 'r') as f:
-        raw_config = json.load(f)
-    
-    # Expand environment variables
-    return expand_env_vars(raw_config)er for the Webapp Factory API.
-
-This module allows loading configuration from JSON files in addition to
-environment variables and Python configuration files.
-"""
+    return _parse_json_config(path.read_bytes())
 
-import json
-import os
-from pathlib import Path
-from typing import Dict, Any, Optional
 
-from config.auth import AuthConfig, JWTConfig, SecurityPolicyConfig, GoogleOAuthConfig
-from config.database import DatabaseConfig, FirestoreConfig, RedisConfig
-from config.features import FeatureFlagsConfig, FeatureFlag, FeatureFlagStrategy
-from config.logging import LoggingConfig, LogHandler, LogLevel, LogFormat
-from config.base import Environment
+def _parse_json_config(raw: bytes) -> Dict[str, Any]:
+    # Parsed in one pass by pydantic-core's JSON parser (the one behind
+    # model_validate_json); only walk the tree when it contains placeholders
+    if b'${' not in raw:
+        return from_json(raw)
+    return expand_env_vars(from_json(raw))
 
 
-def load_json_config(config_path: str) -> Dict[str, Any]:
-    """Load configuration from JSON file."""
-    path = Path(config_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
-    
-    with open(path, 'r') as f:
-        return json.load(f)
+def _json_environment(json_data: Dict[str, Any]) -> Environment:
+    return Environment(json_data.get("environment", "development"))
 
 
-def json_to_auth_config(json_data: Dict[str, Any]) -> AuthConfig:
+def json_to_auth_config(
+    json_data: Dict[str, Any], environment: Optional[Environment] = None
+) -> AuthConfig:
     """Convert JSON data to AuthConfig object."""
     auth_data = json_data.get("auth", {})
     
@@ -143,7 +155,7 @@ def json_to_auth_config(json_data: Dict[str, Any]) -> AuthConfig:
     
     # Create auth config
     auth_config = AuthConfig(
-        environment=Environment(json_data.get("environment", "development")),
+        environment=environment or _json_environment(json_data),
         jwt=jwt_config,
         security_policy=security_config,
         google_oauth=google_oauth,
@@ -158,7 +170,9 @@ def json_to_auth_config(json_data: Dict[str, Any]) -> AuthConfig:
     return auth_config
 
 
-def json_to_database_config(json_data: Dict[str, Any]) -> DatabaseConfig:
+def json_to_database_config(
+    json_data: Dict[str, Any], environment: Optional[Environment] = None
+) -> DatabaseConfig:
     """Convert JSON data to DatabaseConfig object."""
     db_data = json_data.get("database", {})
     
@@ -185,7 +199,7 @@ def json_to_database_config(json_data: Dict[str, Any]) -> DatabaseConfig:
     
     # Create database config
     db_config = DatabaseConfig(
-        environment=Environment(json_data.get("environment", "development")),
+        environment=environment or _json_environment(json_data),
         firestore=firestore_config,
         redis=redis_config
     )
@@ -193,41 +207,48 @@ def json_to_database_config(json_data: Dict[str, Any]) -> DatabaseConfig:
     return db_config
 
 
-def json_to_features_config(json_data: Dict[str, Any]) -> FeatureFlagsConfig:
+def json_to_features_config(
+    json_data: Dict[str, Any], environment: Optional[Environment] = None
+) -> FeatureFlagsConfig:
     """Convert JSON data to FeatureFlagsConfig object."""
     features_data = json_data.get("features", {})
     
+    # Flags are passed as plain dicts so pydantic builds them all while
+    # validating the config, instead of one constructor call per flag
+    flags_data = features_data.get("flags", {})
+    default_flags = {
+        flag_key: {
+            "key": flag_key,
+            "name": flag_data.get("name", flag_key.replace("_", " ").title()),
+            "description": flag_data.get("description", ""),
+            "enabled": flag_data.get("enabled", False),
+            "strategy": flag_data.get("strategy", "none"),
+            "percentage": flag_data.get("percentage", 0),
+            "whitelist_users": flag_data.get("whitelist_users", []),
+            "blacklist_users": flag_data.get("blacklist_users", []),
+        }
+        for flag_key, flag_data in flags_data.items()
+    }
+    
     # Create features config
     features_config = FeatureFlagsConfig(
-        environment=Environment(json_data.get("environment", "development")),
+        environment=environment or _json_environment(json_data),
         storage_backend=features_data.get("storage_backend", "memory"),
         cache_ttl_seconds=features_data.get("cache_ttl_seconds", 300),
         strict_mode=features_data.get("strict_mode", False),
         log_evaluations=features_data.get("log_evaluations", True),
         admin_api_enabled=features_data.get("admin_api_enabled", True),
         metrics_enabled=features_data.get("metrics_enabled", True),
-        analytics_enabled=features_data.get("analytics_enabled", True)
+        analytics_enabled=features_data.get("analytics_enabled", True),
+        default_flags=default_flags
     )
     
-    # Load feature flags
-    flags_data = features_data.get("flags", {})
-    for flag_key, flag_data in flags_data.items():
-        feature_flag = FeatureFlag(
-            key=flag_key,
-            name=flag_data.get("name", flag_key.replace("_", " ").title()),
-            description=flag_data.get("description", ""),
-            enabled=flag_data.get("enabled", False),
-            strategy=FeatureFlagStrategy(flag_data.get("strategy", "none")),
-            percentage=flag_data.get("percentage", 0),
-            whitelist_users=flag_data.get("whitelist_users", []),
-            blacklist_users=flag_data.get("blacklist_users", [])
-        )
-        features_config.add_default_flag(feature_flag)
-    
     return features_config
 
 
-def json_to_logging_config(json_data: Dict[str, Any]) -> LoggingConfig:
+def json_to_logging_config(
+    json_data: Dict[str, Any], environment: Optional[Environment] = None
+) -> LoggingConfig:
     """Convert JSON data to LoggingConfig object."""
     logging_data = json_data.get("logging", {})
     
@@ -246,7 +267,7 @@ def json_to_logging_config(json_data: Dict[str, Any]) -> LoggingConfig:
     
     # Create logging config
     logging_config = LoggingConfig(
-        environment=Environment(json_data.get("environment", "development")),
+        environment=environment or _json_environment(json_data),
         root_level=LogLevel(logging_data.get("root_level", "INFO")),
         log_format=LogFormat(logging_data.get("format", "json")),
         handlers=handlers,
@@ -260,27 +281,129 @@ def json_to_logging_config(json_data: Dict[str, Any]) -> LoggingConfig:
     return logging_config
 
 
-def load_config_from_json(config_path: str) -> Dict[str, Any]:
-    """Load complete configuration from JSON file."""
-    json_data = load_json_config(config_path)
+# Sections built from the raw JSON (and its parsed environment) only when first accessed
+_SECTION_BUILDERS = {
+    "environment": lambda json_data, environment: environment,
+    "auth": json_to_auth_config,
+    "database": json_to_database_config,
+    "features": json_to_features_config,
+    "logging": json_to_logging_config,
+}
+
+
+class LazyConfig(Mapping[str, Any]):
+    """
+    Read-only configuration mapping loaded from JSON.
+
+    The ``environment``, ``auth``, ``database``, ``features`` and ``logging``
+    sections are converted on first access (``cfg["auth"]`` or ``cfg.auth``)
+    and memoized, so a caller that only needs logging never builds the auth
+    or database configs. Plain ``urls``/``api`` values are available directly.
+    """
+
+    __slots__ = ("_json_data", "_environment", "_values", "_cache")
+
+    def __init__(self, json_data: Dict[str, Any]):
+        self._json_data = json_data
+        # Parsed once and shared by every section
+        self._environment = _json_environment(json_data)
+        self._values = {**json_data.get("urls", {}), **json_data.get("api", {})}
+        self._cache: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        builder = _SECTION_BUILDERS.get(key)
+        if builder is None:
+            return self._values[key]
+        value = self._cache[key] = builder(self._json_data, self._environment)
+        return value
+
+    def inherit_sections(self, previous: "LazyConfig") -> None:
+        """
+        Reuse sections already built by ``previous`` whose JSON is unchanged.
+
+        Each section depends only on ``environment`` and its own key, so when
+        both compare equal the validated object is carried over instead of
+        being converted and validated again.
+        """
+        old_data = previous._json_data
+        same_env = self._json_data.get("environment") == old_data.get("environment")
+        if not same_env:
+            return
+        for name, value in previous._cache.items():
+            if self._json_data.get(name) == old_data.get(name):
+                self._cache.setdefault(name, value)
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __iter__(self):
+        yield from _SECTION_BUILDERS
+        yield from (key for key in self._values if key not in _SECTION_BUILDERS)
+
+    def __len__(self) -> int:
+        return len(_SECTION_BUILDERS) + sum(1 for key in self._values if key not in _SECTION_BUILDERS)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _SECTION_BUILDERS or key in self._values
+
+
+# abspath -> ((mtime_ns, size), blake2b digest, loaded config); one entry per file
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], bytes, "LazyConfig"]] = {}
+
+
+def load_config_from_json(config_path: str) -> LazyConfig:
+    """
+    Load complete configuration from JSON file.
+
+    Sub-configs are built lazily (see ``LazyConfig``). Results are cached per
+    file and reused while the file's mtime and size are unchanged, or while
+    its contents hash the same, so the returned mapping is shared and
+    read-only; on reload, sections whose JSON did not change are carried
+    over. Environment variables are expanded when the file is (re)loaded;
+    call ``clear_config_cache()`` to pick up changed variables.
+    """
+    path = os.path.abspath(config_path)
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
     
-    return {
-        "environment": Environment(json_data.get("environment", "development")),
-        "auth": json_to_auth_config(json_data),
-        "database": json_to_database_config(json_data),
-        "features": json_to_features_config(json_data),
-        "logging": json_to_logging_config(json_data),
-        **json_data.get("urls", {}),
-        **json_data.get("api", {})
-    }
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[2]
+    
+    raw = Path(path).read_bytes()
+    digest = hashlib.blake2b(raw, digest_size=16).digest()
+    if cached is not None and cached[1] == digest:
+        # Touched or rewritten with identical contents
+        _CONFIG_CACHE[path] = (stamp, digest, cached[2])
+        return cached[2]
+    
+    config = LazyConfig(_parse_json_config(raw))
+    if cached is not None:
+        # Hot reload: only sections that actually changed are validated again
+        config.inherit_sections(cached[2])
+    _CONFIG_CACHE[path] = (stamp, digest, config)
+    return config
+
+
+def clear_config_cache() -> None:
+    """Drop cached results of ``load_config_from_json`` and ``find_config_file``."""
+    _CONFIG_CACHE.clear()
+    _find_config_file.cache_clear()
 
 
-def export_config_to_json(config: Dict[str, Any], output_path: str) -> None:
+def export_config_to_json(config: Mapping[str, Any], output_path: str) -> None:
     """Export configuration to JSON file."""
     # This would be a more complex function to serialize the config objects back to JSON
     # For now, we'll create a simplified version
     serializable_config = {
-        "environment": str(config.get("environment", "development")),
+        "environment": config.get("environment", "development"),
         "api": {
             "debug": config.get("debug", False),
             "port": config.get("api_port", 8000),
@@ -289,37 +412,58 @@ def export_config_to_json(config: Dict[str, Any], output_path: str) -> None:
         # Add more serialization as needed
     }
     
-    with open(output_path, 'w') as f:
-        json.dump(serializable_config, f, indent=2)
+    # orjson writes enums (Environment) by value; default=str covers anything else
+    Path(output_path).write_bytes(
+        orjson.dumps(serializable_config, default=str, option=orjson.OPT_INDENT_2)
+    )
 
 
 # Configuration file discovery
-def find_config_file(environment: str = None) -> Optional[str]:
-    """Find configuration file for the given environment."""
-    if environment is None:
-        environment = os.getenv("APP_ENV", "development")
-    
-    # Look for JSON config files
-    possible_paths = [
-        f"config.{environment}.json",
-        f"config/{environment}.json",
-        f"configs/{environment}.json",
-        "config.json"
-    ]
+def _list_dir(directory: str) -> FrozenSet[str]:
+    try:
+        return frozenset(os.listdir(directory))
+    except (FileNotFoundError, NotADirectoryError):
+        return frozenset()
+
+
+@lru_cache(maxsize=None)
+def _find_config_file(environment: str, cwd: str) -> Optional[str]:
+    # One listing per directory instead of a stat per candidate path
+    root = _list_dir(".")
+    # Candidates in priority order: (directory listing, file name, path)
+    possible_paths = (
+        (root, f"config.{environment}.json", f"config.{environment}.json"),
+        (_list_dir("config"), f"{environment}.json", f"config/{environment}.json"),
+        (_list_dir("configs"), f"{environment}.json", f"configs/{environment}.json"),
+        (root, "config.json", "config.json"),
+    )
     
-    for path in possible_paths:
-        if Path(path).exists():
+    for listing, name, path in possible_paths:
+        if name in listing:
             return path
     
     return None
 
 
+def find_config_file(environment: str = None) -> Optional[str]:
+    """
+    Find configuration file for the given environment.
+
+    The result is cached per environment and working directory; call
+    ``clear_config_cache()`` after adding or removing config files.
+    """
+    if environment is None:
+        environment = env_snapshot().get("APP_ENV", "development")
+    return _find_config_file(environment, os.getcwd())
+
+
+
 # Auto-load configuration
-def auto_load_config() -> Optional[Dict[str, Any]]:
+def auto_load_config() -> Optional[Mapping[str, Any]]:
     """Automatically load configuration from available files."""
     config_file = find_config_file()
     if config_file:
-        print(f"Loading configuration from: {config_file}")
+        logger.info("Loading configuration from: %s", config_file)
         return load_config_from_json(config_file)
     
     return None
\ No newline at end of file
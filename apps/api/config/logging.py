@@ -11,7 +11,7 @@ This module provides comprehensive configuration for:
 
 from typing import Dict, List, Optional, Any, Union
 from enum import Enum
-from pydantic import Field, validator
+from pydantic import Field, PrivateAttr, validator
 from .base import BaseConfig, Environment
 
 
@@ -271,24 +271,41 @@ class LoggingConfig(BaseConfig):
     log_permission_denied: bool = Field(default=True, description="Log permission denied events")
     log_rate_limit_hits: bool = Field(default=True, description="Log rate limit violations")
     
+    # name -> first handler with that name, built for the list object in
+    # _indexed_handlers; assigning a new handlers list rebuilds it
+    _handler_index: Dict[str, LogHandler] = PrivateAttr(default_factory=dict)
+    _indexed_handlers: Optional[List[LogHandler]] = PrivateAttr(default=None)
+    
+    def _handlers_by_name(self) -> Dict[str, LogHandler]:
+        if self._indexed_handlers is not self.handlers:
+            index: Dict[str, LogHandler] = {}
+            for handler in self.handlers:
+                index.setdefault(handler.name, handler)
+            self._handler_index = index
+            self._indexed_handlers = self.handlers
+        return self._handler_index
+    
     def add_handler(self, handler: LogHandler) -> None:
         """Add a log handler."""
+        self._handlers_by_name().setdefault(handler.name, handler)
         self.handlers.append(handler)
     
     def get_handler(self, name: str) -> Optional[LogHandler]:
         """Get a log handler by name."""
-        for handler in self.handlers:
-            if handler.name == name:
-                return handler
-        return None
+        return self._handlers_by_name().get(name)
     
     def remove_handler(self, name: str) -> bool:
         """Remove a log handler by name."""
-        for i, handler in enumerate(self.handlers):
-            if handler.name == name:
+        handler = self._handlers_by_name().get(name)
+        if handler is None:
+            return False
+        for i, existing in enumerate(self.handlers):
+            if existing is handler:
                 del self.handlers[i]
-                return True
-        return False
+                break
+        # Another handler may share the name; re-index on next lookup
+        self._indexed_handlers = None
+        return True
 
 
 # Default configurations
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
-import json
 import os
 from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
+import orjson
 from pydantic import BaseModel, ConfigDict, Field
 
+from .base import env_snapshot
+
 
 def _default_sources(*values: str) -> List[str]:
     return list(values)
@@ -29,7 +31,7 @@ class CSPTenantOverride(BaseModel):
     frame_ancestors: Optional[List[str]] = Field(default=None, alias="frameAncestors")
     directives: Dict[str, List[str]] = Field(default_factory=dict)
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 class CSPDirectives(BaseModel):
@@ -51,7 +53,7 @@ class CSPDirectives(BaseModel):
     report_uri: Optional[str] = Field(default=None, alias="reportUri")
     upgrade_insecure_requests: bool = Field(default=True, alias="upgradeInsecureRequests")
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 class HSTSConfig(BaseModel):
@@ -60,7 +62,7 @@ class HSTSConfig(BaseModel):
     include_subdomains: bool = Field(default=True, alias="includeSubDomains")
     preload: bool = False
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 class SecurityHeadersConfig(BaseModel):
@@ -81,41 +83,58 @@ class SecurityHeadersConfig(BaseModel):
         alias="permissionsPolicy",
     )
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 def _load_from_path(path: Path) -> SecurityHeadersConfig:
-    with path.open("r", encoding="utf-8") as handle:
-        data = json.load(handle)
-    return SecurityHeadersConfig(**data)
+    return SecurityHeadersConfig(**orjson.loads(path.read_bytes()))
 
 
 DEFAULT_SECURITY_CONFIG = SecurityHeadersConfig()
 
 
 @lru_cache(maxsize=1)
-def get_security_config() -> SecurityHeadersConfig:
-    """Load security header configuration from JSON path or environment defaults."""
+def _load_security_config(
+    path: Optional[str], mtime_ns: Optional[int], inline_json: Optional[str]
+) -> SecurityHeadersConfig:
+    # Keyed on the file's mtime, so an edited file is parsed again on the next call
+    if path and mtime_ns is not None:
+        try:
+            return _load_from_path(Path(path))
+        except Exception:  # pragma: no cover - invalid configs fallback to defaults
+            return DEFAULT_SECURITY_CONFIG
 
-    path = os.getenv("APP_SECURITY_CONFIG_PATH")
-    if path:
-        candidate = Path(path)
-        if candidate.exists():
-            try:
-                return _load_from_path(candidate)
-            except Exception:  # pragma: no cover - invalid configs fallback to defaults
-                return DEFAULT_SECURITY_CONFIG
-
-    inline_json = os.getenv("APP_SECURITY_CONFIG_JSON")
     if inline_json:
         try:
-            return SecurityHeadersConfig(**json.loads(inline_json))
+            return SecurityHeadersConfig(**orjson.loads(inline_json))
         except Exception:  # pragma: no cover - invalid configs fallback to defaults
             return DEFAULT_SECURITY_CONFIG
 
     return DEFAULT_SECURITY_CONFIG
 
 
+def get_security_config() -> SecurityHeadersConfig:
+    """
+    Load security header configuration from JSON path or environment defaults.
+
+    The parsed config is cached per file modification time, so edits to the
+    file at ``APP_SECURITY_CONFIG_PATH`` are picked up on the next call
+    (SecurityHeadersMiddleware rebuilds its headers when a new config object
+    is returned). Changed variables are picked up after ``env_snapshot`` is
+    cleared.
+    """
+
+    env = env_snapshot()
+    path = env.get("APP_SECURITY_CONFIG_PATH")
+    mtime_ns = None
+    if path:
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            pass
+    return _load_security_config(path, mtime_ns, env.get("APP_SECURITY_CONFIG_JSON"))
+
+
 __all__ = [
     "CSPDirectives",
     "CSPTenantOverride",
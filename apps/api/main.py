@@ -1,15 +1,18 @@
+import logging
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from api.settings import settings
+from fastapi.responses import ORJSONResponse
+from api.settings import CORS_ORIGINS, settings
 from api.routes import health, auth, users, protected, google_auth, payments, consent, notifications, feedback
-from api.middleware.request_id import RequestIDMiddleware
-from api.middleware.logging import LoggingMiddleware
-from api.middleware.security_headers import SecurityHeadersMiddleware
+from api.middleware.combined import CombinedMiddleware
+from api.providers.firestore import close_firestore_client, get_firestore_client
+from api.services.auth_service import _get_redirect_uri
+from prometheus_client import make_asgi_app
 
 
-app = FastAPI(title="Webapp Factory API", version="1.0.0")
+app = FastAPI(title="Webapp Factory API", version="1.0.0", default_response_class=ORJSONResponse)
 
-import logging
 logger = logging.getLogger("uvicorn.error")
 
 
@@ -20,27 +23,48 @@ def log_startup_info():
         client_id = getattr(settings, 'GOOGLE_CLIENT_ID', None)
         client_secret_present = bool(getattr(settings, 'GOOGLE_CLIENT_SECRET', None))
         try:
-            redirect_uri = __import__('api.services.auth_service', fromlist=['_get_redirect_uri'])._get_redirect_uri('google')
+            redirect_uri = _get_redirect_uri('google')
         except Exception:
             redirect_uri = None
         logger.info("Auth startup: GOOGLE_CLIENT_ID=%s GOOGLE_CLIENT_SECRET_PRESENT=%s OAUTH_REDIRECT_URI=%s", client_id, client_secret_present, redirect_uri)
     except Exception:
         logger.exception("Failed to log startup auth info")
 
-# Add security headers middleware
-app.add_middleware(SecurityHeadersMiddleware)
-app.add_middleware(RequestIDMiddleware)
-app.add_middleware(LoggingMiddleware)
+
+@app.on_event("startup")
+def warm_firestore_client():
+    # Open the shared Firestore client (gRPC channel + credentials) before the
+    # first request instead of paying the handshake on it.
+    if settings.is_testing():
+        return
+    try:
+        get_firestore_client()
+    except Exception:
+        logger.warning("Firestore client warm-up failed; it will be created on first use", exc_info=True)
+
+
+@app.on_event("shutdown")
+def shutdown_firestore_client():
+    try:
+        close_firestore_client()
+    except Exception:
+        logger.exception("Failed to close Firestore client")
+
+# Access logging, request IDs and security headers in a single layer
+app.add_middleware(CombinedMiddleware)
+# CORSMiddleware keeps allow_origins as given and checks `origin in allow_origins`
+# per request, so a frozenset makes that an O(1) lookup.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins,
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
     expose_headers=["*"],
 )
 
-app.include_router(health.router)
+# Health probes are plain Starlette routes (no dependency resolution or response model)
+app.router.routes.extend(health.routes)
 app.include_router(auth.router, prefix="/auth", tags=["auth"])
 # New Google OAuth routes with GIS popup flow
 app.include_router(google_auth.router, prefix="/auth", tags=["auth", "google"])
@@ -52,6 +76,5 @@ app.include_router(notifications.router)
 app.include_router(feedback.router)
 
 # Prometheus metrics endpoint
-from prometheus_client import make_asgi_app
 metrics_app = make_asgi_app()
 app.mount("/metrics", metrics_app)
@@ -1,17 +1,152 @@
-import json, time
-from starlette.middleware.base import BaseHTTPMiddleware
-
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request, call_next):
-        start = time.time()
-        resp = await call_next(request)
-        dur = int((time.time() - start) * 1000)
-        log = {
-            "ts": time.time(),
-            "method": request.method,
-            "path": request.url.path,
-            "status": resp.status_code,
-            "duration_ms": dur,
-        }
-        print(json.dumps(log))
-        return resp
+import atexit
+import logging
+import queue
+import random
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Iterable, Optional
+import orjson
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Fraction of successful requests that get an access log line; 5xx responses
+# are always logged.
+DEFAULT_SAMPLE_RATE = 0.01
+
+# Probe and scrape endpoints are hit constantly and never get an access log
+# line; they bypass the middleware entirely.
+DEFAULT_SKIP_PATHS = frozenset({"/healthz", "/readyz", "/metrics", "/metrics/"})
+
+# Access log records waiting for the writer thread; when it falls this far
+# behind, new records are dropped instead of blocking requests (and the count
+# is logged as a warning with the next line written).
+_QUEUE_SIZE = 10_000
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """QueueHandler that counts and drops records when the queue is full."""
+
+    dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The listener runs in this process, so the record is passed as is and
+        # formatting is left to the writer thread
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _JsonLineFormatter(logging.Formatter):
+    """Renders an access log record as one JSON line, like the original print()."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return orjson.dumps(record.args).decode()
+
+
+class _AccessLogWriter(logging.StreamHandler):
+    """Writes access log lines to stdout and reports lines dropped since the last write."""
+
+    def __init__(self, queue_handler: _DroppingQueueHandler):
+        super().__init__(sys.stdout)
+        self.setFormatter(_JsonLineFormatter())
+        self.queue_handler = queue_handler
+        self.reported = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        dropped = self.queue_handler.dropped
+        if dropped != self.reported:
+            logging.getLogger("uvicorn.error").warning(
+                "Access log queue full; dropped %d access log lines", dropped - self.reported
+            )
+            self.reported = dropped
+        super().emit(record)
+
+
+_queue_handler = None
+
+
+def _start_log_listener() -> None:
+    # Access log lines go through a queue so formatting and the write() calls
+    # happen on a background thread, off the request path. The logger has its
+    # own level and stdout handler so lines are written even when the
+    # application never configures logging.
+    global _queue_handler
+    if _queue_handler is not None:
+        return
+    log_queue = queue.Queue(_QUEUE_SIZE)
+    queue_handler = _DroppingQueueHandler(log_queue)
+    listener = QueueListener(log_queue, _AccessLogWriter(queue_handler))
+    listener.start()
+    atexit.register(listener.stop)
+    _queue_handler = queue_handler
+    logger.addHandler(_queue_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+class LoggingMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = DEFAULT_SAMPLE_RATE,
+        skip_paths: Iterable[str] = DEFAULT_SKIP_PATHS,
+        enabled: Optional[bool] = None,
+    ):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.skip_paths = frozenset(skip_paths)
+        # Defaults to LoggingConfig.log_requests
+        self.enabled = settings.logging.log_requests if enabled is None else enabled
+        _start_log_listener()
+
+    def wants(self, scope: Scope) -> bool:
+        """Whether this HTTP request may get an access log line."""
+        return (
+            self.enabled
+            and scope['path'] not in self.skip_paths
+            # logger.info would drop the record anyway; skip the wrapper and timing
+            and logger.isEnabledFor(logging.INFO)
+        )
+
+    def log(self, scope: Scope, status_code: int, start_ns: int) -> None:
+        """Log a finished request, subject to sampling; 5xx are always logged."""
+        if status_code >= 500 or random.random() < self.sample_rate:
+            # Clocks beyond the start are only read for requests that get logged
+            duration_ns = time.perf_counter_ns() - start_ns
+            logger.info(
+                "%(method)s %(path)s %(status)d %(duration_ms)dms",
+                {
+                    "ts": time.time() - duration_ns / 1e9,
+                    "method": scope['method'],
+                    "path": scope['path'],
+                    "status": status_code,
+                    "duration_ms": duration_ns // 1_000_000,
+                },
+            )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http' or not self.wants(scope):
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.perf_counter_ns()
+        status_code = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.log(scope, status_code, start_ns)
@@ -2,44 +2,92 @@
 
 from __future__ import annotations
 
-import os
-from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import Headers, QueryParams
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from ..config.base import env_snapshot
 from ..config.security import CSPDirectives, HSTSConfig, SecurityHeadersConfig, get_security_config
 from ..settings import settings
 
+RawHeaders = List[Tuple[bytes, bytes]]
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+# Headers whose values never depend on configuration
+_FIXED_HEADERS: RawHeaders = [
+    (b'x-content-type-options', b'nosniff'),
+    (b'x-frame-options', b'SAMEORIGIN'),
+    (b'x-xss-protection', b'1; mode=block'),
+]
+
+
+def _encode_headers(headers: Dict[str, str]) -> RawHeaders:
+    # Same encoding Starlette applies to header names and values
+    return [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers.items()]
+
+
+class SecurityHeadersMiddleware:
     """Apply opinionated security headers based on configuration."""
 
-    def __init__(self, app):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp):
+        self.app = app
         self._connect_extras = self._collect_connect_sources()
+        self.reload()
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        response = await call_next(request)
+    def reload(self) -> None:
+        """Rebuild the precomputed header values from the current security config."""
         config = get_security_config()
+        self._config = config
 
-        tenant_id = self._resolve_tenant(request)
-        header_name, csp_value = self._build_csp_header(config.csp, tenant_id)
-        response.headers[header_name] = csp_value
-
-        response.headers['X-Content-Type-Options'] = 'nosniff'
-        response.headers['X-Frame-Options'] = 'SAMEORIGIN'
-        response.headers['X-XSS-Protection'] = '1; mode=block'
-        response.headers['Referrer-Policy'] = config.referrer_policy
-
+        # Everything except CSP is the same for every response
+        headers: Dict[str, str] = {'Referrer-Policy': config.referrer_policy}
         permissions_policy = self._build_permissions_policy(config.permissions_policy)
         if permissions_policy:
-            response.headers['Permissions-Policy'] = permissions_policy
+            headers['Permissions-Policy'] = permissions_policy
+        hsts = self._build_hsts_header(config.hsts)
+        if hsts:
+            headers['Strict-Transport-Security'] = hsts
+
+        # CSP only varies for tenants that have overrides; any other tenant
+        # gets the default policy. Each variant is the full raw header list.
+        static_headers = _FIXED_HEADERS + _encode_headers(headers)
+        csp_name, csp_value = self._build_csp_header(config.csp, None)
+        self._default_headers = _encode_headers({csp_name: csp_value}) + static_headers
+        self._tenant_headers: Dict[str, RawHeaders] = {}
+        for tenant in config.csp.per_tenant:
+            csp_name, csp_value = self._build_csp_header(config.csp, tenant)
+            self._tenant_headers[tenant] = _encode_headers({csp_name: csp_value}) + static_headers
+        # Names of the headers this middleware owns; existing values are replaced
+        self._header_names = frozenset(name for name, _ in self._default_headers)
+
+    def headers_for(self, scope: Scope) -> RawHeaders:
+        """Return the raw security headers for this request (CSP depends on the tenant)."""
+        if get_security_config() is not self._config:
+            self.reload()
+        if self._tenant_headers:
+            return self._tenant_headers.get(self._resolve_tenant(scope), self._default_headers)
+        return self._default_headers
+
+    def apply(self, message: Message, security_headers: RawHeaders) -> None:
+        """Set the security headers on an http.response.start message, replacing existing values."""
+        names = self._header_names
+        raw = [header for header in message.get('headers', ()) if header[0] not in names]
+        raw.extend(security_headers)
+        message['headers'] = raw
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
 
-        self._apply_hsts(response, config.hsts)
+        security_headers = self.headers_for(scope)
 
-        return response
+        async def send_wrapper(message: Message):
+            if message['type'] == 'http.response.start':
+                self.apply(message, security_headers)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
 
     def _build_csp_header(self, csp: CSPDirectives, tenant: Optional[str]) -> Tuple[str, str]:
         overrides = csp.per_tenant.get(tenant) if tenant else None
@@ -106,29 +154,31 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         return [value.strip() for value in values if value and value.strip()]
 
     @staticmethod
-    def _resolve_tenant(request: Request) -> Optional[str]:
+    def _resolve_tenant(scope: Scope) -> Optional[str]:
+        headers = Headers(scope=scope)
         header_keys = ('x-tenant-id', 'x-tenant', 'x-org-id')
         for key in header_keys:
-            value = request.headers.get(key)
+            value = headers.get(key)
             if value:
                 return value.strip().lower()
-        tenant = request.query_params.get('tenant')
+        tenant = QueryParams(scope.get('query_string', b'')).get('tenant')
         return tenant.strip().lower() if tenant else None
 
-    def _collect_connect_sources(self) -> List[str]:
-        origins = set()
+    def _collect_connect_sources(self) -> Tuple[str, ...]:
+        # Runs once per middleware instance; the result feeds every CSP variant
+        origins = {'https://accounts.google.com', 'https://oauth2.googleapis.com'}
         auth_config = getattr(settings, 'auth_config', None)
         if auth_config and getattr(auth_config, 'cors_origins', None):
             origins.update(auth_config.cors_origins)
 
-        env_origins = os.getenv('APP_CORS_ORIGINS')
+        env_origins = env_snapshot().get('APP_CORS_ORIGINS')
         if env_origins:
             origins.update(item.strip() for item in env_origins.split(',') if item.strip())
 
-        origins.update({'https://accounts.google.com', 'https://oauth2.googleapis.com'})
-        return sorted(origins)
+        return tuple(sorted(origins))
 
-    def _apply_hsts(self, response: Response, hsts_config: bool | HSTSConfig) -> None:
+    @staticmethod
+    def _build_hsts_header(hsts_config: bool | HSTSConfig) -> Optional[str]:
         if isinstance(hsts_config, bool):
             enabled = hsts_config
             config = HSTSConfig() if hsts_config else None
@@ -137,16 +187,16 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             config = hsts_config
 
         if not enabled or not config:
-            return
+            return None
         if settings.ENV != 'production':  # Maintain conservative default outside production
-            return
+            return None
 
         header = f"max-age={config.max_age}"
         if config.include_subdomains:
             header += '; includeSubDomains'
         if config.preload:
             header += '; preload'
-        response.headers['Strict-Transport-Security'] = header
+        return header
 
     @staticmethod
     def _build_permissions_policy(policy: Dict[str, str]) -> Optional[str]:
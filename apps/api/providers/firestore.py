@@ -5,7 +5,7 @@ from typing import Optional
 
 from google.cloud import firestore
 
-from ..settings import settings
+from ..settings import PROJECT_ID, settings
 
 logger = logging.getLogger("uvicorn.error")
 
@@ -16,7 +16,7 @@ def _resolve_project_id() -> str:
     """Resolve the Firestore project ID from settings or environment."""
     # The config system exposes GOOGLE_PROJECT_ID via settings; fall back to env vars
     # Prefer explicit APP_ env var (from .env files) so local overrides work, then settings, then legacy env
-    project_id = os.getenv("APP_GOOGLE_PROJECT_ID") or getattr(settings, "GOOGLE_PROJECT_ID", None) or os.getenv("GOOGLE_PROJECT_ID")
+    project_id = os.getenv("APP_GOOGLE_PROJECT_ID") or PROJECT_ID or os.getenv("GOOGLE_PROJECT_ID")
     if project_id:
         logger.debug("Resolved Firestore project id from env/settings: %s", project_id)
         return project_id
@@ -141,6 +141,18 @@ def reset_firestore_client():
     _client = None
 
 
+def close_firestore_client():
+    """Close the cached Firestore client (if any) and drop the reference."""
+    global _client
+    if _client is None:
+        return
+    logger.info("Closing cached Firestore client")
+    try:
+        _client.close()
+    finally:
+        _client = None
+
+
 def get_collection_name(key: str, default: str) -> str:
     """
     Resolve a Firestore collection name from database configuration.
@@ -1,10 +1,58 @@
+import hashlib
+import hmac
+import time
+
 import stripe as _stripe
 from ..settings import settings
 
 stripe = _stripe
 stripe.api_key = settings.stripe_secret_key
 
-def verify_signature(payload: bytes, sig: str | None):
-    if not settings.stripe_webhook_secret:
-        raise ValueError("Missing STRIPE_WEBHOOK_SECRET")
-    return stripe.Webhook.construct_event(payload, sig, settings.stripe_webhook_secret)
+
+class WebhookSignatureVerifier:
+    """
+    Incremental Stripe webhook signature check.
+
+    Stripe signs ``"{t}.{body}"`` with HMAC-SHA256, so the body can be fed in
+    chunks as it is received instead of being buffered first. Applies the same
+    checks (v1 scheme, timestamp tolerance) as ``stripe.Webhook.construct_event``.
+
+    Raises ValueError when the secret is missing or the header/signature is invalid.
+    """
+
+    def __init__(self, sig: str | None, tolerance: int = stripe.Webhook.DEFAULT_TOLERANCE):
+        # Read per request so reload_configuration() and secret rotation apply
+        secret = settings.stripe_webhook_secret
+        if not secret:
+            raise ValueError("Missing STRIPE_WEBHOOK_SECRET")
+        if not sig:
+            raise ValueError("Missing Stripe-Signature header")
+
+        timestamp = None
+        signatures = []
+        for item in sig.split(","):
+            key, _, value = item.partition("=")
+            if key == "t":
+                timestamp = value
+            elif key == "v1":
+                signatures.append(value)
+        try:
+            self.timestamp = int(timestamp)
+        except (TypeError, ValueError):
+            raise ValueError("Unable to extract timestamp and signatures from header") from None
+        if not signatures:
+            raise ValueError("No signatures found with expected scheme v1")
+
+        self.signatures = signatures
+        self.tolerance = tolerance
+        self._mac = hmac.new(secret.encode(), b"%d." % self.timestamp, hashlib.sha256)
+
+    def update(self, chunk: bytes) -> None:
+        self._mac.update(chunk)
+
+    def verify(self) -> None:
+        expected = self._mac.hexdigest()
+        if not any(hmac.compare_digest(expected, s) for s in self.signatures):
+            raise ValueError("No signatures found matching the expected signature for payload")
+        if self.tolerance and self.timestamp < time.time() - self.tolerance:
+            raise ValueError(f"Timestamp outside the tolerance zone ({self.timestamp})")
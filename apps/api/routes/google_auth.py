@@ -14,7 +14,7 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 import logging
 import os
-from typing import Optional
+from typing import Collection, Optional
 from urllib.parse import urlparse
 
 from api.services.google_oauth_service import get_google_oauth_service, GoogleOAuthService
@@ -41,7 +41,7 @@ class RefreshTokenRequest(BaseModel):
     refresh_token: str
 
 
-def _verify_origin(request: Request, allowed_origins: list[str]) -> str:
+def _verify_origin(request: Request, allowed_origins: Collection[str]) -> str:
     """
     Verify request origin for CSRF protection
     
@@ -50,7 +50,7 @@ def _verify_origin(request: Request, allowed_origins: list[str]) -> str:
     
     Args:
         request: FastAPI request
-        allowed_origins: List of allowed origin URLs
+        allowed_origins: Allowed origin URLs
         
     Returns:
         Verified origin
@@ -108,12 +108,27 @@ def _verify_csrf_header(x_requested_with: Optional[str]) -> None:
         )
 
 
-def _get_allowed_origins() -> list[str]:
-    """Get list of allowed CORS origins from configuration"""
+# (auth config the set was built from, allowed origins)
+_allowed_origins_cache: tuple[object, frozenset[str]] | None = None
+
+
+def _get_allowed_origins() -> frozenset[str]:
+    """
+    Get the allowed CORS origins from configuration.
+
+    The set is built once and rebuilt only when settings load a new auth
+    config (e.g. after ``reload_configuration()``).
+    """
+    global _allowed_origins_cache
+    
+    auth_config = getattr(settings, "auth_config", None)
+    cached = _allowed_origins_cache
+    if cached is not None and cached[0] is auth_config:
+        return cached[1]
+    
     origins = []
     
     # Get from settings
-    auth_config = getattr(settings, "auth_config", None)
     if auth_config and hasattr(auth_config, "cors_origins"):
         origins.extend(auth_config.cors_origins)
     
@@ -126,7 +141,9 @@ def _get_allowed_origins() -> list[str]:
         logger.warning("No CORS origins configured, using defaults")
         origins = ["http://127.0.0.1:5173", "http://localhost:3000"]
     
-    return [o.strip() for o in origins]
+    allowed = frozenset(o.strip() for o in origins)
+    _allowed_origins_cache = (auth_config, allowed)
+    return allowed
 
 
 def _get_cookie_config() -> dict:
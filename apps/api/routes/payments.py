@@ -1,9 +1,10 @@
 import json
 
+import orjson
 from fastapi import APIRouter, HTTPException, Request, status
 from fastapi.responses import JSONResponse
 
-from ..providers.stripe import verify_signature
+from ..providers.stripe import WebhookSignatureVerifier
 from ..providers.shopify import verify_shopify_signature
 from ..services.billing_service import BillingEvent, apply_billing_event
 from ..services import user_service
@@ -24,22 +25,24 @@ async def billing_webhook_default(request: Request):
 
 @router.post('/webhook/{provider}')
 async def billing_webhook(provider: str, request: Request):
-    payload = await request.body()
     provider_key = provider.lower()
 
     if provider_key == "stripe":
-        sig = request.headers.get('stripe-signature')
+        # Feed the body into the signature HMAC as it streams in, keeping the
+        # chunks so it is joined once for parsing after verification.
+        chunks = []
         try:
-            event = verify_signature(payload, sig)
+            verifier = WebhookSignatureVerifier(request.headers.get('stripe-signature'))
+            async for chunk in request.stream():
+                verifier.update(chunk)
+                chunks.append(chunk)
+            verifier.verify()
+            event_payload = orjson.loads(b"".join(chunks))
         except Exception as exc:  # noqa: BLE001
             raise HTTPException(status_code=400, detail=str(exc))
 
-        if hasattr(event, "to_dict_recursive"):
-            event_payload = event.to_dict_recursive()
-        elif isinstance(event, dict):
-            event_payload = event
-        else:
-            event_payload = {"type": getattr(event, "type", None)}
+        if not isinstance(event_payload, dict):
+            raise HTTPException(status_code=400, detail="Invalid JSON payload: expected an object")
 
         event_type = event_payload.get("type")
         event_id = event_payload.get("id")
@@ -116,6 +119,7 @@ async def billing_webhook(provider: str, request: Request):
         return JSONResponse(status_code=status_code, content={"received": True, "handled": handled})
 
     if provider_key == "shopify":
+        payload = await request.body()
         signature = request.headers.get("X-Shopify-Hmac-Sha256")
         topic = (request.headers.get("X-Shopify-Topic") or "").lower()
 
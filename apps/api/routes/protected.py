@@ -2,9 +2,9 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from typing import Dict, Any
 from ..auth.deps import (
     auth_required, 
-    require_roles, 
-    require_plan, 
-    require_feature, 
+    require_roles_http,
+    require_plan_http,
+    require_feature_http,
     require_org,
     optional_auth
 )
@@ -30,7 +30,7 @@ def get_current_user(claims: AuthClaims = Depends(auth_required)) -> Dict[str, A
 
 
 @router.get("/admin/users")
-def list_users_admin(claims: AuthClaims = Depends(require_roles("admin", "owner"))) -> Dict[str, Any]:
+def list_users_admin(claims: AuthClaims = Depends(require_roles_http("admin", "owner"))) -> Dict[str, Any]:
     """
     Admin endpoint to list all users.
     Requires 'admin' or 'owner' role.
@@ -44,7 +44,7 @@ def list_users_admin(claims: AuthClaims = Depends(require_roles("admin", "owner"
 
 
 @router.get("/admin/system/health")
-def system_health_admin(claims: AuthClaims = Depends(require_roles("admin"))) -> Dict[str, Any]:
+def system_health_admin(claims: AuthClaims = Depends(require_roles_http("admin"))) -> Dict[str, Any]:
     """
     System health endpoint restricted to admins only.
     Requires 'admin' role specifically.
@@ -57,7 +57,7 @@ def system_health_admin(claims: AuthClaims = Depends(require_roles("admin"))) ->
 
 
 @router.get("/pro/export")
-def export_data_pro(claims: AuthClaims = Depends(require_plan("pro", "enterprise"))) -> Dict[str, Any]:
+def export_data_pro(claims: AuthClaims = Depends(require_plan_http("pro", "enterprise"))) -> Dict[str, Any]:
     """
     Data export feature for Pro+ subscribers.
     Requires 'pro' or 'enterprise' subscription plan.
@@ -71,7 +71,7 @@ def export_data_pro(claims: AuthClaims = Depends(require_plan("pro", "enterprise
 
 
 @router.get("/enterprise/analytics")
-def advanced_analytics(claims: AuthClaims = Depends(require_plan("enterprise"))) -> Dict[str, Any]:
+def advanced_analytics(claims: AuthClaims = Depends(require_plan_http("enterprise"))) -> Dict[str, Any]:
     """
     Advanced analytics for Enterprise customers.
     Requires 'enterprise' subscription plan.
@@ -88,7 +88,7 @@ def advanced_analytics(claims: AuthClaims = Depends(require_plan("enterprise")))
 
 
 @router.get("/labs/vector-search")
-def vector_search_labs(claims: AuthClaims = Depends(require_feature("vector_search"))) -> Dict[str, Any]:
+def vector_search_labs(claims: AuthClaims = Depends(require_feature_http("vector_search"))) -> Dict[str, Any]:
     """
     Vector search feature in labs.
     Requires 'vector_search' feature flag to be enabled.
@@ -102,7 +102,7 @@ def vector_search_labs(claims: AuthClaims = Depends(require_feature("vector_sear
 
 
 @router.get("/labs/ai-assistant")
-def ai_assistant_labs(claims: AuthClaims = Depends(require_feature("ai_assistant"))) -> Dict[str, Any]:
+def ai_assistant_labs(claims: AuthClaims = Depends(require_feature_http("ai_assistant"))) -> Dict[str, Any]:
     """
     AI assistant feature in labs.
     Requires 'ai_assistant' feature flag to be enabled.
@@ -157,7 +157,7 @@ def update_org_settings(
 @router.get("/org/{org_id}/admin/billing")
 def org_billing_admin(
     org_id: str,
-    claims: AuthClaims = Depends(require_roles("admin", "owner"))
+    claims: AuthClaims = Depends(require_roles_http("admin", "owner"))
 ) -> Dict[str, Any]:
     """
     Get organization billing information.
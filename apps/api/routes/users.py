@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import Response
 
-from ..auth.deps import auth_required, require_roles
+from ..auth.deps import auth_required, require_roles_http
 from ..auth.models import AuthClaims
 from ..schemas.user import (
     UserListResponse,
@@ -48,7 +48,7 @@ async def get_user(user_id: str, claims: AuthClaims = Depends(auth_required)):
     "/",
     response_model=UserProfile,
     status_code=status.HTTP_201_CREATED,
-    dependencies=[Depends(require_roles("admin"))],
+    dependencies=[Depends(require_roles_http("admin"))],
 )
 async def create_user(payload: UserProfileCreate):
     try:
@@ -61,7 +61,7 @@ async def create_user(payload: UserProfileCreate):
 @router.patch(
     "/{user_id}",
     response_model=UserProfile,
-    dependencies=[Depends(require_roles("admin"))],
+    dependencies=[Depends(require_roles_http("admin"))],
 )
 async def update_user(user_id: str, payload: UserProfileUpdate):
     try:
@@ -74,7 +74,7 @@ async def update_user(user_id: str, payload: UserProfileUpdate):
 @router.delete(
     "/{user_id}",
     status_code=status.HTTP_204_NO_CONTENT,
-    dependencies=[Depends(require_roles("admin"))],
+    dependencies=[Depends(require_roles_http("admin"))],
 )
 async def delete_user(user_id: str):
     try:
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Dict, Any
 import jwt
 import os
@@ -166,14 +167,23 @@ def build_login_url(provider_name: str, redirect: str) -> str:
     
     # Generate state for CSRF protection
     state = secrets.token_urlsafe(32)
-    
-    # Build authorization URL
+    return _build_login_url_template(provider_name, client_id, redirect_uri) + state
+
+
+@lru_cache(maxsize=32)
+def _build_login_url_template(provider_name: str, client_id: str, redirect_uri: str) -> str:
+    """
+    Build the authorization URL for a provider up to the trailing ``state`` value.
+
+    Everything except ``state`` is fixed per provider/client/redirect URI, so the
+    encoded query string is built once; ``state`` is URL-safe and is appended as is.
+    """
+    provider = get_provider(provider_name)
     params = {
         "client_id": client_id,
         "redirect_uri": redirect_uri,
         "response_type": "code",
         "scope": " ".join(provider.scopes),
-        "state": state,
     }
     
     # Provider-specific parameters
@@ -182,8 +192,7 @@ def build_login_url(provider_name: str, redirect: str) -> str:
             "access_type": "offline",
             "prompt": "consent",
         })
-    auth_url = f"{provider.authorization_url}?{urlencode(params)}"
-    return auth_url
+    return f"{provider.authorization_url}?{urlencode(params)}&state="
 
 
 async def exchange_code(provider_name: str, code: str, state: str) -> Session:
@@ -3,6 +3,19 @@ FEATURES = {
     "reports.generate": {"plans": ["pro", "enterprise"]},
 }
 
+
+def _build_plan_features(features: dict) -> dict[str, frozenset[str]]:
+    plan_features: dict[str, set[str]] = {}
+    for feature, meta in features.items():
+        for plan in meta["plans"]:
+            plan_features.setdefault(plan, set()).add(feature)
+    return {plan: frozenset(names) for plan, names in plan_features.items()}
+
+
+# Reverse index plan -> features so lookups are a single set membership test
+_PLAN_FEATURES = _build_plan_features(FEATURES)
+_EMPTY: frozenset[str] = frozenset()
+
+
 def has_feature(plan: str, feature: str) -> bool:
-    f = FEATURES.get(feature)
-    return bool(f and plan in f["plans"])
+    return feature in _PLAN_FEATURES.get(plan, _EMPTY)
@@ -18,13 +18,14 @@ import os
 import secrets
 import logging
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 import httpx
 import jwt as pyjwt
 from cryptography.fernet import Fernet
 from fastapi import HTTPException
 
+from ..config.google_oauth import get_google_oauth_config
 from ..settings import settings
 
 logger = logging.getLogger("uvicorn.error")
@@ -41,8 +42,7 @@ class GoogleOAuthService:
     
     def __init__(self):
         """Initialize Google OAuth service"""
-        self.client_id = self._get_client_id()
-        self.client_secret = self._get_client_secret()
+        self.client_id, self.client_secret = self._get_client_credentials()
         self.encryption_key = self._get_encryption_key()
         self.fernet = Fernet(self.encryption_key)
         
@@ -51,33 +51,15 @@ class GoogleOAuthService:
         self._jwks_cache_time: Optional[datetime] = None
         self._jwks_cache_ttl = timedelta(hours=1)
     
-    def _get_client_id(self) -> str:
-        """Get Google OAuth client ID from environment"""
-        client_id = (
-            os.getenv("APP_GOOGLE_CLIENT_ID") 
-            or os.getenv("GOOGLE_CLIENT_ID")
-            or getattr(settings, "GOOGLE_CLIENT_ID", None)
-        )
-        if not client_id:
-            raise HTTPException(
-                status_code=500,
-                detail="Google OAuth not configured. Set APP_GOOGLE_CLIENT_ID or GOOGLE_CLIENT_ID"
-            )
-        return client_id
-    
-    def _get_client_secret(self) -> str:
-        """Get Google OAuth client secret from environment"""
-        client_secret = (
-            os.getenv("APP_GOOGLE_CLIENT_SECRET")
-            or os.getenv("GOOGLE_CLIENT_SECRET")
-            or getattr(settings, "GOOGLE_CLIENT_SECRET", None)
-        )
-        if not client_secret:
-            raise HTTPException(
-                status_code=500,
-                detail="Google OAuth not configured. Set APP_GOOGLE_CLIENT_SECRET or GOOGLE_CLIENT_SECRET"
-            )
-        return client_secret
+    def _get_client_credentials(self) -> Tuple[str, str]:
+        """Get Google OAuth client ID and secret from the shared OAuth config"""
+        # get_google_oauth_config applies the APP_* / plain env / settings
+        # precedence once per process
+        try:
+            config = get_google_oauth_config()
+        except ValueError as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from None
+        return config.client_id, config.client_secret
     
     def _get_encryption_key(self) -> bytes:
         """Get or generate encryption key for refresh tokens"""
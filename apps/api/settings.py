@@ -6,22 +6,19 @@ for existing code that imports from settings.py.
 """
 
 import os
-from typing import Any, Dict, Optional
+import sys
+from typing import Any, Dict, Final, Mapping, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from config.base import Environment
+from config.base import Environment, env_snapshot
 from config.auth import AuthConfig, get_auth_config
 from config.database import DatabaseConfig, get_database_config
 from config.features import FeatureFlagsConfig, get_feature_flags_config
 from config.logging import LoggingConfig, get_logging_config
 
-# Import environment-specific configurations
-from config.environments import (
-    get_development_config,
-    get_testing_config,
-    get_production_config,
-    validate_production_config
-)
+# Environment-specific configurations; the package loads each environment
+# module on first use, so only the active one is imported.
+from config import environments
 
 # Dynamically choose an env file so developers can keep per-environment files like
 # `.env.development` without having to copy them to `.env` every time. The
@@ -66,6 +63,9 @@ if chosen_env and os.path.exists(chosen_env):
         # still attempt to load values from other sources.
         pass
 
+# The env file may have added APP_* variables; drop any snapshot taken earlier
+env_snapshot.cache_clear()
+
 
 class Settings(BaseSettings):
     """
@@ -94,7 +94,7 @@ class Settings(BaseSettings):
     _database_config: Optional[DatabaseConfig] = None
     _features_config: Optional[FeatureFlagsConfig] = None
     _logging_config: Optional[LoggingConfig] = None
-    _environment_config: Optional[Dict[str, Any]] = None
+    _environment_config: Optional[Mapping[str, Any]] = None
     
     model_config = SettingsConfigDict(
         env_file=chosen_env,
@@ -112,11 +112,10 @@ class Settings(BaseSettings):
         environment = self._get_environment()
         
         # Load component configurations
-        self._auth_config = get_auth_config()
-        self._auth_config.environment = environment
+        # Auth and database configs are frozen; their factories cache one per environment
+        self._auth_config = get_auth_config(environment)
         
-        self._database_config = get_database_config()
-        self._database_config.environment = environment
+        self._database_config = get_database_config(environment)
         
         self._features_config = get_feature_flags_config()
         self._features_config.environment = environment
@@ -125,14 +124,14 @@ class Settings(BaseSettings):
         self._logging_config.environment = environment
         
         # Load environment-specific configuration
-        if environment == Environment.DEVELOPMENT:
-            self._environment_config = get_development_config()
-        elif environment == Environment.TESTING:
-            self._environment_config = get_testing_config()
-        elif environment == Environment.PRODUCTION:
-            self._environment_config = get_production_config()
+        if environment is Environment.DEVELOPMENT:
+            self._environment_config = environments.get_development_config()
+        elif environment is Environment.TESTING:
+            self._environment_config = environments.get_testing_config()
+        elif environment is Environment.PRODUCTION:
+            self._environment_config = environments.get_production_config()
         else:
-            self._environment_config = get_development_config()
+            self._environment_config = environments.get_development_config()
     
     def _get_environment(self) -> Environment:
         """Get the current environment."""
@@ -157,14 +156,14 @@ class Settings(BaseSettings):
             return self._auth_config.google_oauth.client_id
         # Return None when not configured so callers can detect a missing
         # configuration instead of silently using a placeholder value.
-        return os.getenv("APP_GOOGLE_CLIENT_ID", None)
+        return env_snapshot().get("APP_GOOGLE_CLIENT_ID", None)
     
     @property
     def GOOGLE_CLIENT_SECRET(self) -> str:
         """Google OAuth client secret (backward compatibility)."""
         if self._auth_config and self._auth_config.google_oauth:
             return self._auth_config.google_oauth.client_secret
-        return os.getenv("APP_GOOGLE_CLIENT_SECRET", None)
+        return env_snapshot().get("APP_GOOGLE_CLIENT_SECRET", None)
     
     @property
     def OAUTH_REDIRECT_URI(self) -> str:
@@ -172,49 +171,49 @@ class Settings(BaseSettings):
         if self._auth_config:
             return self._auth_config.oauth_redirect_uri
         # Do not provide a hardcoded default here; prefer explicit configuration via env or auth config.
-        return os.getenv("APP_OAUTH_REDIRECT_URI")
+        return env_snapshot().get("APP_OAUTH_REDIRECT_URI")
     
     @property
     def GOOGLE_PROJECT_ID(self) -> str:
         """Google Cloud Project ID (backward compatibility)."""
         if self._database_config:
             return self._database_config.firestore.project_id
-        return os.getenv("APP_GOOGLE_PROJECT_ID", "webapp-factory-dev")
+        return env_snapshot().get("APP_GOOGLE_PROJECT_ID", "webapp-factory-dev")
     
     @property
     def JWT_SECRET_KEY(self) -> str:
         """JWT secret key (backward compatibility)."""
         if self._auth_config:
             return self._auth_config.jwt.secret_key
-        return os.getenv("APP_JWT_SECRET_KEY", "test-secret-key-for-development-only")
+        return env_snapshot().get("APP_JWT_SECRET_KEY", "test-secret-key-for-development-only")
     
     @property
     def JWT_ALGORITHM(self) -> str:
         """JWT algorithm (backward compatibility)."""
         if self._auth_config:
             return self._auth_config.jwt.algorithm
-        return os.getenv("APP_JWT_ALGORITHM", "HS256")
+        return env_snapshot().get("APP_JWT_ALGORITHM", "HS256")
     
     @property
     def JWT_ACCESS_TOKEN_EXPIRE_MINUTES(self) -> int:
         """JWT access token expiration (backward compatibility)."""
         if self._auth_config:
             return self._auth_config.jwt.access_token_expire_minutes
-        return int(os.getenv("APP_JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "15"))
+        return int(env_snapshot().get("APP_JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "15"))
     
     @property
     def JWT_AUDIENCE(self) -> str:
         """JWT audience (backward compatibility)."""
         if self._auth_config:
             return self._auth_config.jwt.audience
-        return os.getenv("APP_JWT_AUDIENCE", "webapp-factory")
+        return env_snapshot().get("APP_JWT_AUDIENCE", "webapp-factory")
     
     @property
     def JWT_ISSUER(self) -> str:
         """JWT issuer (backward compatibility)."""
         if self._auth_config:
             return self._auth_config.jwt.issuer
-        return os.getenv("APP_JWT_ISSUER", "webapp-factory-api")
+        return env_snapshot().get("APP_JWT_ISSUER", "webapp-factory-api")
     
     @property
     def cors_origins(self) -> list[str]:
@@ -270,7 +269,7 @@ class Settings(BaseSettings):
         if self._environment_config:
             return self._environment_config.get("api_base_url", "http://localhost:8000")
         # Do not hardcode base URL; require APP_BASE_URL in environment or environment config.
-        return os.getenv("APP_BASE_URL")
+        return env_snapshot().get("APP_BASE_URL")
     
     @property
     def FRONTEND_BASE_URL(self) -> str:
@@ -278,7 +277,7 @@ class Settings(BaseSettings):
         if self._environment_config:
             return self._environment_config.get("frontend_base_url", "http://127.0.0.1:5173")
         # Do not hardcode frontend URL; prefer explicit APP_FRONTEND_BASE_URL setting.
-        return os.getenv("APP_FRONTEND_BASE_URL")
+        return env_snapshot().get("APP_FRONTEND_BASE_URL")
 
     @property
     def TELEGRAM_BOT_TOKEN(self) -> Optional[str]:
@@ -323,21 +322,21 @@ class Settings(BaseSettings):
         return self._logging_config or get_logging_config()
     
     @property
-    def environment_config(self) -> Dict[str, Any]:
+    def environment_config(self) -> Mapping[str, Any]:
         """Get environment-specific configuration."""
         return self._environment_config or {}
     
     def is_development(self) -> bool:
         """Check if running in development environment."""
-        return self._get_environment() == Environment.DEVELOPMENT
+        return self._get_environment() is Environment.DEVELOPMENT
     
     def is_testing(self) -> bool:
         """Check if running in testing environment."""
-        return self._get_environment() == Environment.TESTING
+        return self._get_environment() is Environment.TESTING
     
     def is_production(self) -> bool:
         """Check if running in production environment."""
-        return self._get_environment() == Environment.PRODUCTION
+        return self._get_environment() is Environment.PRODUCTION
     
     def validate_configuration(self) -> list[str]:
         """Validate the current configuration and return issues."""
@@ -346,7 +345,7 @@ class Settings(BaseSettings):
         if self.is_production():
             # Validate production configuration
             if self._environment_config:
-                prod_issues = validate_production_config(self._environment_config)
+                prod_issues = environments.validate_production_config(self._environment_config)
                 issues.extend(prod_issues)
             
             # Additional validation
@@ -360,15 +359,42 @@ class Settings(BaseSettings):
     
     def reload_configuration(self):
         """Reload all configurations from environment variables."""
+        env_snapshot.cache_clear()
+        get_auth_config.cache_clear()
+        get_database_config.cache_clear()
+        _clear_loaded_caches()
         self._load_configurations()
 
 
+# Cached factories that read the environment, as (module, function). The
+# config package is importable both as ``config`` and
+# ``api.config``; only modules already loaded can hold a cached value.
+_RELOADABLE_CACHES = (
+    ("config.environments.development", "get_development_config"),
+    ("config.environments.testing", "get_testing_config"),
+    ("config.environments.production", "get_production_config"),
+    ("config.base", "env_snapshot"),
+    ("config.google_oauth", "get_google_oauth_config"),
+    ("config.google_oauth", "validate_production_config"),
+)
+
+
+def _clear_loaded_caches() -> None:
+    for module_name, func_name in _RELOADABLE_CACHES:
+        for name in (module_name, f"api.{module_name}"):
+            module = sys.modules.get(name)
+            if module is not None:
+                getattr(module, func_name).cache_clear()
+
+
 # Create global settings instance
 settings = Settings()
 
 
-# Validate configuration on startup
-if settings.is_production():
+# Validate configuration on startup. Deployments that already gate on
+# `python scripts/config_manager.py validate production` in CI can skip this
+# with APP_VALIDATE_CONFIG=0.
+if settings.is_production() and env_snapshot().get("APP_VALIDATE_CONFIG", "1") != "0":
     config_issues = settings.validate_configuration()
     if config_issues:
         import warnings
@@ -376,6 +402,13 @@ if settings.is_production():
             warnings.warn(f"Configuration issue: {issue}", UserWarning)
 
 
+# Values read on request paths, resolved once at import so callers do a plain
+# module-global lookup instead of going through the Settings properties. Use
+# ``settings`` directly for anything that may change after reload_configuration().
+PROJECT_ID: Final[str] = settings.GOOGLE_PROJECT_ID
+CORS_ORIGINS: Final[frozenset[str]] = frozenset(settings.cors_origins)
+
+
 # Export commonly used configuration objects for convenience
 auth_config = settings.auth
 database_config = settings.database
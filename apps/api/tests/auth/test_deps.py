@@ -84,7 +84,7 @@ class TestAuthRequired:
         assert claims.sub == "user_123"
         assert claims.email == "test@example.com"
         assert claims.orgId == "org_abc"
-        assert claims.roles == ["member"]
+        assert claims.roles == ("member",)
         assert claims.plan == "pro"
     
     def test_auth_required_missing_header(self):
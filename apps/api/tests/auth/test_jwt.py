@@ -2,17 +2,22 @@
 Tests for JWT utilities - signing, verification, and token creation.
 """
 
+import time
+
 import pytest
 import jwt
 from datetime import datetime, timezone, timedelta
 from unittest.mock import patch
 
+import auth.jwt as auth_jwt
 from auth.jwt import (
     sign_access_jwt,
     verify_access_jwt,
     create_test_jwt,
     create_preset_tokens,
     JWTError,
+    TokenCache,
+    clear_verify_cache,
     APP_JWT_SECRET,
     APP_JWT_AUDIENCE,
     APP_JWT_ISSUER,
@@ -197,6 +202,69 @@ class TestJWTVerification:
         
         assert "Invalid token" in str(exc_info.value.detail)
 
+    def test_verify_jwt_wrong_issuer(self):
+        """Test verifying JWT with wrong issuer."""
+        now = datetime.now(timezone.utc)
+        payload = {
+            "sub": "test_user",
+            "iat": int(now.timestamp()),
+            "exp": int((now + timedelta(minutes=15)).timestamp()),
+            "aud": APP_JWT_AUDIENCE,
+            "iss": "https://evil.example.com",
+        }
+        token = jwt.encode(payload, APP_JWT_SECRET, algorithm=APP_JWT_ALG)
+
+        with pytest.raises(JWTError) as exc_info:
+            verify_access_jwt(token)
+
+        assert "Invalid token" in str(exc_info.value.detail)
+
+    def test_verify_jwt_missing_issuer(self):
+        """Test verifying JWT without an issuer claim."""
+        now = datetime.now(timezone.utc)
+        payload = {
+            "sub": "test_user",
+            "iat": int(now.timestamp()),
+            "exp": int((now + timedelta(minutes=15)).timestamp()),
+            "aud": APP_JWT_AUDIENCE,
+        }
+        token = jwt.encode(payload, APP_JWT_SECRET, algorithm=APP_JWT_ALG)
+
+        with pytest.raises(JWTError) as exc_info:
+            verify_access_jwt(token)
+
+        assert "Invalid token" in str(exc_info.value.detail)
+
+    def test_verify_jwt_signed_with_other_secret(self):
+        """Test verifying JWT signed with a different secret."""
+        now = datetime.now(timezone.utc)
+        payload = {
+            "sub": "test_user",
+            "exp": int((now + timedelta(minutes=15)).timestamp()),
+            "aud": APP_JWT_AUDIENCE,
+        }
+        token = jwt.encode(payload, "some-other-secret-value-for-tests", algorithm="HS256")
+
+        with pytest.raises(JWTError) as exc_info:
+            verify_access_jwt(token)
+
+        assert "Invalid token" in str(exc_info.value.detail)
+
+    def test_verify_jwt_rejects_unexpected_algorithm(self):
+        """Test tokens using an algorithm other than the configured one are rejected."""
+        now = datetime.now(timezone.utc)
+        payload = {
+            "sub": "test_user",
+            "exp": int((now + timedelta(minutes=15)).timestamp()),
+            "aud": APP_JWT_AUDIENCE,
+        }
+        token = jwt.encode(payload, APP_JWT_SECRET, algorithm="HS512")
+
+        with pytest.raises(JWTError) as exc_info:
+            verify_access_jwt(token)
+
+        assert "Invalid token" in str(exc_info.value.detail)
+
 
 class TestCreateTestJWT:
     """Test test JWT creation utilities."""
@@ -380,4 +448,94 @@ class TestJWTIntegration:
             claims = verify_access_jwt(token)
             assert claims["sub"] == users[i]["sub"]
             assert claims["roles"] == users[i]["roles"]
-            assert claims["plan"] == users[i]["plan"]
\ No newline at end of file
+            assert claims["plan"] == users[i]["plan"]
+
+
+class TestJWTVerifyCache:
+    """Test caching of verified JWT claims."""
+
+    def setup_method(self):
+        clear_verify_cache()
+
+    def test_repeat_verify_skips_decode(self):
+        """Test a reused token is only decoded once."""
+        token = sign_access_jwt(sub="cached_user")
+
+        with patch("auth.jwt._decode_hs256", wraps=auth_jwt._decode_hs256) as decode:
+            first = verify_access_jwt(token)
+            second = verify_access_jwt(token)
+
+        assert decode.call_count == 1
+        assert first == second
+        assert first is not second
+
+    def test_cached_claims_are_isolated(self):
+        """Test mutating returned claims does not leak into the cache."""
+        token = sign_access_jwt(sub="cached_user", roles=["member"])
+
+        verify_access_jwt(token)["sub"] = "tampered"
+        verify_access_jwt(token)["roles"].append("admin")
+
+        claims = verify_access_jwt(token)
+        assert claims["sub"] == "cached_user"
+        assert claims["roles"] == ["member"]
+
+    def test_clear_verify_cache_clears_every_cache(self):
+        """Test clearing also drops entries from other TokenCache instances."""
+        cache = TokenCache()
+        key = TokenCache.key("token")
+        cache.put(key, "value", token_exp=None)
+
+        clear_verify_cache()
+
+        assert cache.get(key) is None
+
+    def test_cache_entry_expires_after_ttl(self):
+        """Test entries are dropped once the TTL elapses."""
+        cache = TokenCache(ttl_seconds=5)
+        key = TokenCache.key("token")
+        cache.put(key, "value", token_exp=None)
+
+        with patch("auth.jwt.time.monotonic", return_value=time.monotonic() + 10):
+            assert cache.get(key) is None
+        assert len(cache) == 0
+
+    def test_cache_does_not_outlive_token(self):
+        """Test already-expired tokens are never cached."""
+        cache = TokenCache()
+        key = TokenCache.key("token")
+        cache.put(key, "value", token_exp=time.time() - 1)
+
+        assert cache.get(key) is None
+
+    def test_cache_skips_non_numeric_exp(self):
+        """Test entries with an unusable exp are not cached."""
+        cache = TokenCache()
+        key = TokenCache.key("token")
+        cache.put(key, "value", token_exp=["not", "a", "number"])
+
+        assert cache.get(key) is None
+        assert len(cache) == 0
+
+    def test_cache_coerces_string_exp(self):
+        """Test a numeric string exp is stored as a float."""
+        cache = TokenCache()
+        key = TokenCache.key("token")
+        cache.put(key, "value", token_exp=str(int(time.time()) + 60))
+
+        assert cache.get(key) == "value"
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test the cache stays bounded by evicting the oldest entry."""
+        cache = TokenCache(max_entries=2)
+        exp = time.time() + 60
+        keys = [TokenCache.key(f"token{i}") for i in range(3)]
+
+        cache.put(keys[0], 0, exp)
+        cache.put(keys[1], 1, exp)
+        cache.get(keys[0])
+        cache.put(keys[2], 2, exp)
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) == 0
+        assert cache.get(keys[2]) == 2
@@ -3,8 +3,6 @@ Tests for AuthClaims model - validation and helper methods.
 """
 
 import pytest
-from pydantic import ValidationError
-
 from auth.models import AuthClaims
 
 
@@ -18,9 +16,9 @@ class TestAuthClaimsValidation:
         assert claims.sub == "user_123"
         assert claims.email is None
         assert claims.orgId is None
-        assert claims.roles == []
+        assert claims.roles == ()
         assert claims.plan is None
-        assert claims.features == []
+        assert claims.features == ()
     
     def test_create_full_claims(self):
         """Test creating AuthClaims with all fields."""
@@ -36,35 +34,27 @@ class TestAuthClaimsValidation:
         assert claims.sub == "user_123"
         assert claims.email == "test@example.com"
         assert claims.orgId == "org_abc"
-        assert claims.roles == ["admin", "owner"]
+        assert claims.roles == ("admin", "owner")
         assert claims.plan == "enterprise"
-        assert claims.features == ["feature1", "feature2"]
+        assert claims.features == ("feature1", "feature2")
     
     def test_missing_required_sub(self):
         """Test validation error when subject is missing."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(TypeError, match="sub"):
             AuthClaims()
-        
-        errors = exc_info.value.errors()
-        assert len(errors) == 1
-        assert errors[0]["field"] == "sub"
-        assert errors[0]["type"] == "missing"
     
     def test_empty_sub_invalid(self):
         """Test validation error when subject is empty."""
-        with pytest.raises(ValidationError) as exc_info:
-            AuthClaims(sub="")
-        
         # Empty string should be invalid for sub
-        errors = exc_info.value.errors()
-        assert len(errors) == 1
+        with pytest.raises(ValueError, match="sub"):
+            AuthClaims(sub="")
     
     def test_default_values(self):
         """Test default values for optional fields."""
         claims = AuthClaims(sub="user_123")
         
-        assert claims.roles == []
-        assert claims.features == []
+        assert claims.roles == ()
+        assert claims.features == ()
         assert claims.email is None
         assert claims.orgId is None
         assert claims.plan is None
@@ -80,16 +70,48 @@ class TestAuthClaimsValidation:
             plan="pro",
             features=["feat1", "feat2"],
         )
-        assert isinstance(claims.roles, list)
-        assert isinstance(claims.features, list)
+        assert isinstance(claims.roles, tuple)
+        assert isinstance(claims.features, tuple)
         
-        # Invalid types should raise ValidationError
-        with pytest.raises(ValidationError):
+        # Invalid types should raise ValueError
+        with pytest.raises(ValueError):
             AuthClaims(sub="user_123", roles="not_a_list")
         
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValueError):
             AuthClaims(sub="user_123", features="not_a_list")
 
+        # Non-string elements are rejected as well
+        with pytest.raises(ValueError, match="roles"):
+            AuthClaims(sub="user_123", roles=[1])
+
+        with pytest.raises(ValueError, match="features"):
+            AuthClaims(sub="user_123", features=("feat1", None))
+
+    def test_claims_are_immutable(self):
+        """Test AuthClaims cannot be mutated after construction."""
+        claims = AuthClaims(sub="user_123", roles=["member"])
+
+        with pytest.raises(AttributeError):
+            claims.roles = ("admin",)
+
+    def test_from_token_claims_ignores_registered_claims(self):
+        """Test building claims from a decoded JWT payload."""
+        claims = AuthClaims.from_token_claims(
+            {
+                "sub": "user_123",
+                "roles": ["admin"],
+                "features": None,
+                "iat": 1,
+                "exp": 2,
+                "aud": "webapp-factory",
+                "iss": "https://api.test.com",
+            }
+        )
+
+        assert claims.sub == "user_123"
+        assert claims.roles == ("admin",)
+        assert claims.features == ()
+
 
 class TestAuthClaimsHelperMethods:
     """Test AuthClaims helper methods."""
@@ -391,8 +413,8 @@ class TestAuthClaimsEdgeCases:
             features=[],
         )
         
-        assert claims.roles == []
-        assert claims.features == []
+        assert claims.roles == ()
+        assert claims.features == ()
         assert claims.has_any_role() is False
         assert claims.has_feature("any") is False
     
@@ -405,8 +427,8 @@ class TestAuthClaimsEdgeCases:
         )
         
         # Duplicates should be preserved (not deduplicated by model)
-        assert claims.roles == ["admin", "admin", "member"]
-        assert claims.features == ["feat1", "feat1", "feat2"]
+        assert claims.roles == ("admin", "admin", "member")
+        assert claims.features == ("feat1", "feat1", "feat2")
         
         # But helper methods should still work
         assert claims.has_role("admin") is True
@@ -0,0 +1,18 @@
+def test_healthz_returns_ok(client):
+    response = client.get("/healthz")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"status": "ok"}
+
+
+def test_readyz_is_not_cacheable(client):
+    response = client.get("/readyz")
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "no-store"
+    assert response.json() == {"ready": True}
+
+
+def test_healthz_rejects_other_methods(client):
+    assert client.post("/healthz").status_code == 405
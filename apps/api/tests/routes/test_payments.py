@@ -190,3 +190,60 @@ def test_shopify_orders_paid_updates_user_record(client, monkeypatch):
     assert billing_meta["provider"] == "shopify"
     assert billing_meta["google_email"] == "user@example.com"
     assert billing_meta["order_id"] == 222333444
+
+
+def _stripe_signature_header(payload: bytes, secret: str, timestamp: int) -> str:
+    signed = f"{timestamp}.".encode("utf-8") + payload
+    digest = hmac.new(secret.encode("utf-8"), signed, hashlib.sha256).hexdigest()
+    return f"t={timestamp},v1={digest}"
+
+
+def test_stripe_webhook_verifies_streamed_body(client, monkeypatch):
+    secret = "whsec_test"
+
+    from api.settings import settings
+    monkeypatch.setattr(settings, "stripe_webhook_secret", secret)
+
+    apply_mock = AsyncMock(return_value=True)
+    monkeypatch.setattr("api.routes.payments.apply_billing_event", apply_mock)
+
+    payload = {
+        "id": "evt_1",
+        "type": "checkout.session.completed",
+        "data": {"object": {"client_reference_id": "user-42", "metadata": {"plan": "pro", "credits": "5"}}},
+    }
+    body = json.dumps(payload).encode("utf-8")
+    timestamp = int(datetime.now(timezone.utc).timestamp())
+
+    response = client.post(
+        "/payments/webhook/stripe",
+        data=body,
+        headers={"Stripe-Signature": _stripe_signature_header(body, secret, timestamp)},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"received": True, "handled": True}
+    event = apply_mock.call_args.args[0]
+    assert event.event_id == "evt_1"
+    assert event.user_id == "user-42"
+    assert event.credits == 5
+
+
+def test_stripe_webhook_rejects_bad_signature(client, monkeypatch):
+    from api.settings import settings
+    monkeypatch.setattr(settings, "stripe_webhook_secret", "whsec_test")
+
+    apply_mock = AsyncMock(return_value=True)
+    monkeypatch.setattr("api.routes.payments.apply_billing_event", apply_mock)
+
+    body = json.dumps({"id": "evt_2", "type": "checkout.session.completed"}).encode("utf-8")
+    timestamp = int(datetime.now(timezone.utc).timestamp())
+
+    response = client.post(
+        "/payments/webhook/stripe",
+        data=body,
+        headers={"Stripe-Signature": _stripe_signature_header(body, "wrong-secret", timestamp)},
+    )
+
+    assert response.status_code == 400
+    apply_mock.assert_not_awaited()
@@ -0,0 +1,96 @@
+"""
+Tests for the access log written by LoggingMiddleware.
+"""
+
+import io
+import logging
+import queue
+
+import orjson
+import pytest
+from starlette.responses import PlainTextResponse
+from starlette.testclient import TestClient
+
+from api.middleware import logging as access_log
+from api.middleware.logging import LoggingMiddleware
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def records():
+    handler = _ListHandler()
+    access_log.logger.addHandler(handler)
+    yield handler.records
+    access_log.logger.removeHandler(handler)
+
+
+def _client(status_code: int, sample_rate: float = 0.0) -> TestClient:
+    app = PlainTextResponse("body", status_code=status_code)
+    return TestClient(LoggingMiddleware(app, sample_rate=sample_rate, enabled=True))
+
+
+def test_server_error_is_logged_without_sampling(records):
+    """Test a 5xx response always produces an access log record."""
+    _client(503).get("/boom")
+
+    assert len(records) == 1
+    record = records[0]
+    assert record.levelno == logging.INFO
+    assert record.getMessage().startswith("GET /boom 503 ")
+    assert record.args["status"] == 503
+
+
+def test_sampled_out_request_is_not_logged(records):
+    """Test successful requests are subject to sampling."""
+    _client(200, sample_rate=0.0).get("/ok")
+
+    assert records == []
+
+
+def test_record_renders_as_json_line(records):
+    """Test the stdout handler writes the fields as one JSON object."""
+    _client(200, sample_rate=1.0).get("/ok")
+
+    line = access_log._JsonLineFormatter().format(records[0])
+    assert orjson.loads(line) == {
+        "ts": pytest.approx(records[0].args["ts"]),
+        "method": "GET",
+        "path": "/ok",
+        "status": 200,
+        "duration_ms": records[0].args["duration_ms"],
+    }
+
+
+def test_logs_without_logging_configuration():
+    """Test the access logger does not depend on the root logger's level."""
+    _client(200)
+
+    assert logging.getLogger().getEffectiveLevel() > logging.INFO
+    assert access_log.logger.isEnabledFor(logging.INFO)
+    assert access_log.logger.propagate is False
+
+
+def test_dropped_lines_are_reported(caplog):
+    """Test lines dropped on a full queue are reported by the writer."""
+    queue_handler = access_log._DroppingQueueHandler(queue.Queue(1))
+    writer = access_log._AccessLogWriter(queue_handler)
+    writer.setStream(io.StringIO())
+    record = logging.LogRecord("access", logging.INFO, __file__, 0, "%(path)s", ({"path": "/"},), None)
+
+    queue_handler.enqueue(record)
+    queue_handler.enqueue(record)
+    with caplog.at_level(logging.WARNING, logger="uvicorn.error"):
+        writer.emit(record)
+        writer.emit(record)
+
+    warnings = [r for r in caplog.records if r.name == "uvicorn.error"]
+    assert len(warnings) == 1
+    assert "dropped 1 access log lines" in warnings[0].getMessage()
@@ -27,3 +27,13 @@ def test_loads_env_file_by_envname(monkeypatch, tmp_path):
 
     # cleanup
     os.remove(target)
+
+
+def test_reload_configuration_rebuilds_environment_configs():
+    from api.settings import settings
+    from config import environments
+
+    before = environments.get_testing_config()
+    settings.reload_configuration()
+
+    assert environments.get_testing_config() is not before